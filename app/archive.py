@@ -0,0 +1,84 @@
+"""
+보존 기간이 지난 논리 삭제 글/유저를 아카이브 테이블로 옮기는 백그라운드 작업
+(복원은 app/blog/crud.py의 restore_blog, app/user/crud.py의 restore_user)
+
+    python -m app.archive   # 주기 작업을 끈 경우 cron 등에서 한 번 실행
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import insert, delete, exists
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Blog, User, BlogArchive, UserArchive, AsyncSessionLocal, dispose_engines
+from app.configs import ARCHIVE_RETENTION_DAYS, ARCHIVE_BATCH_SIZE, ARCHIVE_INTERVAL_SECONDS
+from app.logger import logger
+
+BLOG_ARCHIVE_COLUMNS = ("id", "createdAt", "updatedAt", "title", "content", "viewCount", "userId")
+USER_ARCHIVE_COLUMNS = ("id", "createdAt", "updatedAt", "email", "nickname", "profileUrl", "password")
+
+async def _move_batch(db: AsyncSession, model, archive_model, columns: tuple, condition) -> int:
+    """
+    조건에 맞는 행을 최대 ARCHIVE_BATCH_SIZE개 INSERT ... SELECT로 복사한 뒤 원본에서 삭제 (한 트랜잭션)
+    """
+    # 여러 워커가 동시에 돌아도 같은 행을 옮기지 않도록 잠긴 행은 건너뜀 (SQLite는 무시)
+    statement = (
+        select(model.id)
+        .where(condition)
+        .order_by(model.id)
+        .limit(ARCHIVE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    ids = (await db.exec(statement)).all()
+    if not ids:
+        return 0
+    try:
+        source = select(*(getattr(model, column) for column in columns)).where(model.id.in_(ids))
+        await db.execute(insert(archive_model).from_select(columns, source))
+        await db.execute(delete(model).where(model.id.in_(ids)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return len(ids)
+
+async def archive_deleted_rows(db: AsyncSession, now: Optional[datetime] = None) -> dict:
+    """
+    보존 기간이 지난 논리 삭제 글, 그다음 남은 글이 없는 논리 삭제 유저를 배치 단위로 아카이브
+    """
+    cutoff = (now or datetime.now()) - timedelta(days=ARCHIVE_RETENTION_DAYS)
+    targets = (
+        ("blogs", Blog, BlogArchive, BLOG_ARCHIVE_COLUMNS,
+         (Blog.isDeleted == True) & (Blog.updatedAt < cutoff)),
+        # 글(삭제 대기 중인 글 포함)이 남아 있는 유저는 외래키가 깨지지 않도록 다음 주기로 미룸
+        ("users", User, UserArchive, USER_ARCHIVE_COLUMNS,
+         (User.isDeleted == True) & (User.updatedAt < cutoff) & ~exists().where(Blog.userId == User.id)),
+    )
+    moved = {}
+    for name, model, archive_model, columns, condition in targets:
+        moved[name] = 0
+        while True:
+            count = await _move_batch(db, model, archive_model, columns, condition)
+            moved[name] += count
+            if count < ARCHIVE_BATCH_SIZE:
+                break
+    if any(moved.values()):
+        logger.info(f"아카이브 완료: 글 {moved['blogs']}개, 유저 {moved['users']}명")
+    return moved
+
+async def archive_deleted_rows_periodically(session_factory):
+    while True:
+        await asyncio.sleep(ARCHIVE_INTERVAL_SECONDS)
+        try:
+            async with session_factory() as db:
+                await archive_deleted_rows(db)
+        except Exception as e:
+            logger.error(f"아카이브 작업 실패: {e}")
+
+async def _main():
+    async with AsyncSessionLocal() as db:
+        await archive_deleted_rows(db)
+    await dispose_engines()
+
+if __name__ == "__main__":
+    asyncio.run(_main())
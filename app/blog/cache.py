@@ -0,0 +1,77 @@
+import hashlib
+import orjson
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from app.cache import TTLCache
+from app.configs import BLOG_LIST_CACHE_SIZE, BLOG_LIST_CACHE_TTL, BLOG_CACHE_SIZE, BLOG_CACHE_TTL
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+
+# (범위, 버전, cursor, limit) -> 직렬화된 응답
+# 글이 바뀌면 버전이 올라가 이전 항목은 더 이상 조회되지 않고 LRU/TTL로 정리됨
+blog_list_cache = TTLCache(maxsize=BLOG_LIST_CACHE_SIZE, ttl=BLOG_LIST_CACHE_TTL)
+_versions = {}
+
+def list_version(scope) -> int:
+    return _versions.get(scope, 0)
+
+def invalidate_blog_lists(user_id: int):
+    """
+    전체 목록과 작성자 목록의 캐시 버전 갱신
+    """
+    for scope in ("all", user_id):
+        _versions[scope] = _versions.get(scope, 0) + 1
+
+class CachedBlog(NamedTuple):
+    user_id: Optional[int]
+    response: CachedResponse
+
+# blog_id -> 직렬화된 단건 응답 (수정/삭제/작성자 프로필 변경 시 무효화)
+blog_cache = TTLCache(maxsize=BLOG_CACHE_SIZE, ttl=BLOG_CACHE_TTL)
+
+def invalidate_blog(blog_id: int):
+    blog_cache.invalidate(blog_id)
+
+def invalidate_author_blogs(user_id: int):
+    """
+    단건 응답에 작성자 닉네임/프로필 이미지가 포함되므로 해당 작성자의 글을 모두 무효화
+    """
+    blog_cache.invalidate_where(lambda blog_id, cached: cached.user_id == user_id)
+
+def build_cached_response(content, last_modified: Optional[datetime]) -> CachedResponse:
+    body = orjson.dumps(content, default=jsonable_encoder)
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    if last_modified is not None:
+        # updatedAt은 로컬 시각(naive)으로 저장되므로 UTC로 변환, HTTP 날짜는 초 단위
+        last_modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+    return CachedResponse(body, etag, last_modified)
+
+def _not_modified(request: Request, cached: CachedResponse) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # 압축 응답은 약한 ETag(W/)로 나가므로 약한 비교
+        return cached.etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and cached.last_modified is not None:
+        try:
+            return cached.last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def conditional_response(request: Request, cached: CachedResponse, cache_control: str) -> Response:
+    """
+    ETag/Last-Modified가 일치하면 본문 없이 304, 아니면 캐시된 본문 그대로 응답
+    """
+    headers = {"ETag": cached.etag, "Cache-Control": cache_control}
+    if cached.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(cached.last_modified, usegmt=True)
+    if _not_modified(request, cached):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -1,10 +1,25 @@
-from sqlalchemy.orm import Session
-from app.models import Blog  # Blog 모델은 기존에 정의되어 있다고 가정
-from app.blog.schemas import BlogBase
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import and_, or_, func, insert
+from pydantic import ValidationError
+from fastapi import HTTPException
+from app.models import Blog, BlogArchive, User, use_replica  # Blog 모델은 기존에 정의되어 있다고 가정
+from app.blog.schemas import BlogBase, BlogImport, BlogBatch
+from app.blog.cache import invalidate_blog_lists, invalidate_blog
+from app.blog.search import search_index
+from app.blog.writer import blog_writer
+from app.configs import BLOG_PAGE_DEFAULT_LIMIT, BLOG_PAGE_MAX_LIMIT, BLOG_EXCERPT_LENGTH, BLOG_EXPORT_FETCH_SIZE, BLOG_IMPORT_BATCH_SIZE
 from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+import base64
+import orjson
 
 # 블로그 생성
-def create_blog(db: Session, blog_data: BlogBase, user_id: int):
+async def create_blog(db: AsyncSession, blog_data: BlogBase, user_id: int):
+    if blog_writer.running:
+        # 요청 세션이 커넥션을 쥔 채 기다리면 writer가 풀에서 커넥션을 얻지 못할 수 있으므로 먼저 반납
+        await db.close()
+        return await blog_writer.submit("create", blog_data, user_id)
     new_blog = Blog(
         title=blog_data.title,
         content=blog_data.content,
@@ -12,35 +27,322 @@ def create_blog(db: Session, blog_data: BlogBase, user_id: int):
         createdAt=datetime.now()
     )
     db.add(new_blog)
-    db.commit()
-    db.refresh(new_blog)
+    await db.commit()
+    await db.refresh(new_blog)
+    invalidate_blog_lists(user_id)
+    search_index.apply(new_blog)
     return new_blog
 
+def encode_cursor(blog: Blog) -> str:
+    """
+    마지막 블로그의 (createdAt, id)를 불투명한 커서 문자열로 변환
+    """
+    raw = f"{blog.createdAt.isoformat()}|{blog.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (createdAt, id)로 복원
+    """
+    try:
+        created_at, blog_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(blog_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+async def _paginate(db: AsyncSession, statement, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[Blog], Optional[str]]:
+    """
+    (createdAt, id) 기준 최신순 키셋 페이지네이션
+    """
+    limit = min(max(limit or BLOG_PAGE_DEFAULT_LIMIT, 1), BLOG_PAGE_MAX_LIMIT)
+    if cursor:
+        created_at, blog_id = decode_cursor(cursor)
+        statement = statement.where(or_(
+            Blog.createdAt < created_at,
+            and_(Blog.createdAt == created_at, Blog.id < blog_id),
+        ))
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    statement = use_replica(statement.order_by(Blog.createdAt.desc(), Blog.id.desc()).limit(limit + 1))
+    blogs = (await db.exec(statement)).all()
+    next_cursor = encode_cursor(blogs[limit - 1]) if len(blogs) > limit else None
+    return blogs[:limit], next_cursor
+
+def _summary_select():
+    """
+    목록용 컬럼 projection: 엔티티 대신 필요한 컬럼과 DB에서 자른 본문 요약만 조회
+    작성자는 같은 쿼리에서 join으로 가져와 글 수와 관계없이 쿼리 한 번으로 목록 구성
+    """
+    return (
+        select(
+            Blog.id,
+            Blog.title,
+            func.substr(Blog.content, 1, BLOG_EXCERPT_LENGTH).label("excerpt"),
+            Blog.createdAt,
+            User.nickname.label("author_nickname"),
+            User.profileUrl.label("author_profileUrl"),
+        )
+        .join(User, User.id == Blog.userId, isouter=True)
+    )
+
+def _summary_row(row) -> dict:
+    summary = {"id": row.id, "title": row.title, "excerpt": row.excerpt, "author": None, "createdAt": row.createdAt}
+    if row.author_nickname is not None:
+        summary["author"] = {"nickname": row.author_nickname, "profileUrl": row.author_profileUrl}
+    return summary
+
+async def _paginate_summaries(db: AsyncSession, statement, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[dict], Optional[str]]:
+    rows, next_cursor = await _paginate(db, statement, cursor, limit)
+    return [_summary_row(row) for row in rows], next_cursor
+
 # 모든 블로그 조회
-def get_all_blogs(db: Session):
-    return db.query(Blog).filter(Blog.isDeleted == False).all()  # 삭제되지 않은 블로그만 조회
+async def get_all_blogs(db: AsyncSession, cursor: Optional[str] = None, limit: Optional[int] = None):
+    statement = _summary_select().where(Blog.isDeleted == False)  # 삭제되지 않은 블로그만 조회
+    return await _paginate_summaries(db, statement, cursor, limit)
 
 # 사용자가 작성한 블로그 조회
-def get_blogs_by_user(db: Session, user_id: int):
-    return db.query(Blog).filter(Blog.userId == user_id, Blog.isDeleted == False).all()
+async def get_blogs_by_user(db: AsyncSession, user_id: int, cursor: Optional[str] = None, limit: Optional[int] = None):
+    statement = _summary_select().where(Blog.userId == user_id, Blog.isDeleted == False)
+    return await _paginate_summaries(db, statement, cursor, limit)
+
+# 블로그 단건 조회 (작성자 요약 포함)
+async def get_blog_detail(db: AsyncSession, blog_id: int) -> Optional[dict]:
+    statement = (
+        select(
+            Blog.id,
+            Blog.title,
+            Blog.content,
+            Blog.viewCount,
+            Blog.userId,
+            Blog.createdAt,
+            Blog.updatedAt,
+            User.nickname.label("author_nickname"),
+            User.profileUrl.label("author_profileUrl"),
+        )
+        .join(User, User.id == Blog.userId, isouter=True)
+        .where(Blog.id == blog_id, Blog.isDeleted == False)
+    )
+    row = (await db.exec(use_replica(statement))).first()
+    if row is None:
+        return None
+    author = None
+    if row.author_nickname is not None:
+        author = {"nickname": row.author_nickname, "profileUrl": row.author_profileUrl}
+    return {
+        "id": row.id,
+        "title": row.title,
+        "content": row.content,
+        "author": author,
+        "userId": row.userId,
+        "viewCount": row.viewCount,
+        "createdAt": row.createdAt,
+        "updatedAt": row.updatedAt,
+    }
+
+# 목록의 마지막 변경 시각 (삭제된 글 포함)
+async def get_blogs_last_modified(db: AsyncSession, user_id: Optional[int] = None) -> Optional[datetime]:
+    """
+    목록에 작성자 닉네임/프로필 이미지가 포함되므로 작성자 updatedAt까지 포함한 최댓값
+    (전체 목록은 작성자를 골라내지 않고 전체 유저의 최댓값을 사용, 인덱스 조회 한 번)
+    """
+    blog_updated = select(func.max(Blog.updatedAt))
+    author_updated = select(func.max(User.updatedAt))
+    if user_id is not None:
+        blog_updated = blog_updated.where(Blog.userId == user_id)
+        author_updated = author_updated.where(User.id == user_id)
+    statement = select(blog_updated.scalar_subquery(), author_updated.scalar_subquery())
+    return max(filter(None, (await db.exec(use_replica(statement))).first()), default=None)
+
+# 블로그 검색 (역색인 BM25 순위 -> IN 조회)
+async def search_blogs(db: AsyncSession, query: str, limit: int) -> List[dict]:
+    ranked = search_index.search(query, limit)
+    if not ranked:
+        return []
+    # 목록과 같은 요약 projection (본문 전체/내부 필드는 응답에 포함하지 않음)
+    statement = _summary_select().where(Blog.id.in_([blog_id for blog_id, _ in ranked]), Blog.isDeleted == False)
+    summaries = {row.id: _summary_row(row) for row in (await db.exec(use_replica(statement))).all()}
+    return [summaries[blog_id] for blog_id, _ in ranked if blog_id in summaries]
 
 # 블로그 수정
-def update_blog(db: Session, blog_id: int, blog_data: BlogBase, user_id: int):
-    blog = db.query(Blog).filter(Blog.id == blog_id, Blog.userId == user_id, Blog.isDeleted == False).first()
+def _owned_blogs(blog_ids, user_id: int):
+    """
+    수정/삭제 가능한 글 조회: 본인이 작성했고 삭제되지 않은 글만
+    """
+    return select(Blog).where(Blog.id.in_(blog_ids), Blog.userId == user_id, Blog.isDeleted == False)
+
+async def update_blog(db: AsyncSession, blog_id: int, blog_data: BlogBase, user_id: int):
+    if blog_writer.running:
+        await db.close()
+        return await blog_writer.submit("update", blog_data, user_id, blog_id=blog_id)
+    blog = (await db.exec(_owned_blogs([blog_id], user_id))).first()
     if blog:
         blog.title = blog_data.title
         blog.content = blog_data.content
         blog.updatedAt = datetime.now()
-        db.commit()
-        db.refresh(blog)
+        await db.commit()
+        await db.refresh(blog)
+        invalidate_blog_lists(user_id)
+        invalidate_blog(blog_id)
+        search_index.apply(blog)
         return blog
     return None
 
 # 블로그 삭제 (논리적 삭제)
-def delete_blog(db: Session, blog_id: int, user_id: int):
-    blog = db.query(Blog).filter(Blog.id == blog_id, Blog.userId == user_id, Blog.isDeleted == False).first()
+async def delete_blog(db: AsyncSession, blog_id: int, user_id: int):
+    blog = (await db.exec(_owned_blogs([blog_id], user_id))).first()
     if blog:
         blog.isDeleted = True  # 실제 삭제가 아닌 논리적 삭제 처리
-        db.commit()
+        blog.updatedAt = datetime.now()  # 목록의 Last-Modified에 삭제도 반영되도록 갱신
+        await db.commit()
+        invalidate_blog_lists(user_id)
+        invalidate_blog(blog_id)
+        search_index.apply(blog)
         return True
     return False
+
+# 블로그 일괄 생성/수정/삭제
+async def apply_blog_batch(db: AsyncSession, batch: BlogBatch, user_id: int) -> dict:
+    """
+    대상 글을 IN 조회 한 번으로 가져와 작업 순서대로 적용하고 한 번만 커밋
+    작업별 결과를 반환하며, atomic이면 실패한 작업이 하나라도 있을 때 아무것도 적용하지 않고 나머지 작업도 409(롤백)로 표시
+    """
+    target_ids = {operation.id for operation in batch.operations if operation.op != "create"}
+    blogs = {}
+    if target_ids:
+        blogs = {blog.id: blog for blog in (await db.exec(_owned_blogs(target_ids, user_id))).all()}
+
+    now = datetime.now()
+    results, touched = [], []
+    for operation in batch.operations:
+        if operation.op == "create":
+            blog = Blog(title=operation.title, content=operation.content, userId=user_id, createdAt=now)
+            db.add(blog)
+        else:
+            blog = blogs.get(operation.id)
+            if blog is None or blog.isDeleted:  # 없거나 남의 글이거나 앞선 작업에서 삭제된 글
+                results.append({"op": operation.op, "id": operation.id, "status": 404, "detail": "블로그를 찾을 수 없습니다."})
+                continue
+            if operation.op == "update":
+                blog.title = operation.title
+                blog.content = operation.content
+            else:
+                blog.isDeleted = True
+            blog.updatedAt = now
+        results.append({"op": operation.op, "id": operation.id, "status": 201 if operation.op == "create" else 200, "detail": None})
+        touched.append((len(results) - 1, blog))
+
+    failed = len(touched) < len(batch.operations)
+    if not touched or (batch.atomic and failed):
+        await db.rollback()
+        # 실패 전에 실행된 작업도 적용되지 않았음을 표시 (생성된 글은 id가 없음)
+        for index, _ in touched:
+            results[index].update(status=409, detail="다른 작업이 실패해 롤백되었습니다.")
+        return {"applied": False, "results": results}
+    try:
+        await db.flush()  # 생성된 글의 id 할당
+        for index, blog in touched:
+            results[index]["id"] = blog.id
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"일괄 변경 실패: {str(e.__cause__ or e)}")
+
+    invalidate_blog_lists(user_id)
+    for _, blog in touched:
+        invalidate_blog(blog.id)
+        search_index.apply(blog)
+    return {"applied": True, "results": results}
+
+# 아카이브된 블로그 복원
+async def restore_blog(db: AsyncSession, blog_id: int) -> Blog:
+    """
+    아카이브 테이블의 글을 같은 id로 되살림 (삭제되지 않은 상태로 복원)
+    """
+    archived = await db.get(BlogArchive, blog_id)
+    if not archived:
+        raise HTTPException(status_code=404, detail="아카이브된 블로그가 없습니다.")
+    if archived.userId is not None:
+        author_id = (await db.exec(select(User.id).where(User.id == archived.userId))).first()
+        if author_id is None:
+            raise HTTPException(status_code=409, detail="작성자가 아카이브되어 있습니다. 유저를 먼저 복원하세요.")
+
+    blog = Blog(**archived.model_dump(exclude={"archivedAt"}), isDeleted=False)
+    blog.updatedAt = datetime.now()  # 다른 워커의 검색 인덱스 동기화(watermark)에 잡히도록 갱신
+    db.add(blog)
+    await db.delete(archived)
+    await db.commit()
+    invalidate_blog_lists(blog.userId)
+    search_index.apply(blog)
+    return blog
+
+# 블로그 내보내기 (NDJSON)
+async def export_blogs_ndjson(db: AsyncSession, include_deleted: bool = False) -> AsyncIterator[bytes]:
+    """
+    서버 사이드 커서로 일정 개수씩 읽어 한 줄씩 내보냄 (테이블 크기와 무관하게 메모리 일정)
+    """
+    statement = select(*Blog.__table__.columns).order_by(Blog.id)
+    if not include_deleted:
+        statement = statement.where(Blog.isDeleted == False)
+    result = await db.stream(use_replica(statement).execution_options(yield_per=BLOG_EXPORT_FETCH_SIZE))
+    async for rows in result.partitions():
+        yield b"".join(orjson.dumps(dict(row._mapping)) + b"\n" for row in rows)
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+async def _insert_batch(db: AsyncSession, batch: List[dict], first_line: int, last_line: int, report: dict):
+    # 가져온 글은 updatedAt이 과거일 수 있어 watermark 기반 동기화로는 잡히지 않으므로 배치마다 직접 색인
+    # (MySQL은 RETURNING이 없으므로 삽입 전 최대 id 이후의 행과 id를 지정한 행을 다시 조회)
+    max_id_before = (await db.exec(select(func.max(Blog.id)))).first() or 0
+    explicit_ids = [values["id"] for values in batch if "id" in values]
+    try:
+        await db.execute(insert(Blog), batch)  # executemany
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        report["batches"].append({"lines": [first_line, last_line], "inserted": 0, "error": str(e.__cause__ or e)})
+        return
+    report["inserted"] += len(batch)
+    report["batches"].append({"lines": [first_line, last_line], "inserted": len(batch)})
+    statement = select(Blog).where(or_(Blog.id > max_id_before, Blog.id.in_(explicit_ids)))
+    for blog in (await db.exec(statement)).all():
+        search_index.apply(blog)
+    for user_id in {values.get("userId") for values in batch}:
+        invalidate_blog_lists(user_id)
+
+# 블로그 가져오기 (NDJSON)
+async def import_blogs_ndjson(db: AsyncSession, chunks: AsyncIterator[bytes]) -> dict:
+    """
+    스트리밍 본문을 줄 단위로 검증해 BLOG_IMPORT_BATCH_SIZE 건씩 한 트랜잭션으로 삽입
+    잘못된 줄은 건너뛰고 errors에, 실패한 배치는 batches에 오류와 함께 기록
+    """
+    report = {"inserted": 0, "batches": [], "errors": []}
+    batch, first_line, line_no = [], 1, 0
+    async for line in _iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            row = BlogImport.model_validate(orjson.loads(line))
+        except (orjson.JSONDecodeError, ValidationError) as e:
+            report["errors"].append({"line": line_no, "error": str(e)})
+            continue
+        now = datetime.now()
+        values = row.model_dump(exclude_none=True)
+        values.setdefault("createdAt", now)
+        values.setdefault("updatedAt", values["createdAt"])
+        if not batch:
+            first_line = line_no
+        batch.append(values)
+        if len(batch) >= BLOG_IMPORT_BATCH_SIZE:
+            await _insert_batch(db, batch, first_line, line_no, report)
+            batch = []
+    if batch:
+        await _insert_batch(db, batch, first_line, line_no, report)
+    return report
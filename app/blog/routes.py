@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.blog.crud import create_blog, get_all_blogs, get_blogs_by_user, update_blog, delete_blog
-from app.blog.schemas import BlogBase
-from app.user.auth import AuthJWT
-from app.models import get_db, User  # 데이터베이스 세션 가져오기
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Optional
+from app.blog.crud import create_blog, get_all_blogs, get_blogs_by_user, update_blog, delete_blog, get_blogs_last_modified, search_blogs, export_blogs_ndjson, import_blogs_ndjson, restore_blog, get_blog_detail, apply_blog_batch
+from app.blog.cache import blog_list_cache, blog_cache, CachedBlog, list_version, build_cached_response, conditional_response
+from app.blog.views import record_view
+from app.blog.schemas import BlogBase, BlogSummaryPage, BlogSearchResult, BlogDetail, BlogBatch, BlogBatchResult
+from app.user.auth import get_current_user, get_admin_user
+from app.user.schemas import CurrentUser
+from app.models import get_db, AsyncSessionLocal  # 데이터베이스 세션 가져오기
+from app.configs import BLOG_PAGE_DEFAULT_LIMIT, BLOG_PAGE_MAX_LIMIT, SEARCH_MAX_LIMIT
 from fastapi.responses import JSONResponse
 
 router = APIRouter(
@@ -15,62 +21,136 @@ router = APIRouter(
 @router.post("",summary="블로그 등록")
 async def create_blog_route(
     blog_data: BlogBase,
-    Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    email = Authorize.get_jwt_subject()  # JWT 토큰에서 이메일 추출
-    user = db.query(User).filter(User.email == email).first()  # 이메일로 유저 조회
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
-    
-    new_blog = create_blog(db, blog_data, user.id)  # user.id를 전달하여 블로그 작성
+    new_blog = await create_blog(db, blog_data, user.id)  # user.id를 전달하여 블로그 작성
     return JSONResponse(content={"message": "블로그가 등록되었습니다", "blog": new_blog.title}, status_code=201)
 
 # 전체 블로그 조회
-@router.get("",summary="블로그 전체 조회")
+@router.get("",summary="블로그 전체 조회", responses={200: {"model": BlogSummaryPage}})
 async def get_all_blogs_route(
-    db: Session = Depends(get_db)
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(BLOG_PAGE_DEFAULT_LIMIT, ge=1, le=BLOG_PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_db)
 ):
-    blogs = get_all_blogs(db)
-    if not blogs:
-        raise HTTPException(status_code=404, detail="블로그가 없습니다.")
-    return blogs
+    cache_key = ("all", list_version("all"), cursor, limit)
+    cached = blog_list_cache.get(cache_key)
+    if cached is None:
+        blogs, next_cursor = await get_all_blogs(db, cursor, limit)
+        if not blogs and not cursor:
+            raise HTTPException(status_code=404, detail="블로그가 없습니다.")
+        last_modified = await get_blogs_last_modified(db)
+        cached = build_cached_response({"blogs": blogs, "next_cursor": next_cursor}, last_modified)
+        blog_list_cache.set(cache_key, cached)
+    return conditional_response(request, cached, "no-cache")
 
 # 사용자가 작성한 블로그 조회
-@router.get("/id", summary="내가 쓴 블로그 조회")
+@router.get("/id", summary="내가 쓴 블로그 조회", responses={200: {"model": BlogSummaryPage}})
 async def get_blogs_by_user_route(
-    Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(BLOG_PAGE_DEFAULT_LIMIT, ge=1, le=BLOG_PAGE_MAX_LIMIT),
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    email = Authorize.get_jwt_subject()
-    user = db.query(User).filter(User.email == email).first()  # 이메일로 유저 조회
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
+    cache_key = (user.id, list_version(user.id), cursor, limit)
+    cached = blog_list_cache.get(cache_key)
+    if cached is None:
+        blogs, next_cursor = await get_blogs_by_user(db, user.id, cursor, limit)  # user.id로 블로그 조회
+        if not blogs and not cursor:
+            raise HTTPException(status_code=404, detail="작성한 블로그가 없습니다.")
+        last_modified = await get_blogs_last_modified(db, user.id)
+        cached = build_cached_response({"blogs": blogs, "next_cursor": next_cursor}, last_modified)
+        blog_list_cache.set(cache_key, cached)
     
-    blogs = get_blogs_by_user(db, user.id)  # user.id로 블로그 조회
-    if not blogs:
-        raise HTTPException(status_code=404, detail="작성한 블로그가 없습니다.")
-    
-    return blogs
+    return conditional_response(request, cached, "private, no-cache")
+
+# 블로그 검색
+@router.get("/search", summary="블로그 검색", response_model=BlogSearchResult)
+async def search_blogs_route(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT),
+    db: AsyncSession = Depends(get_db)
+):
+    blogs = await search_blogs(db, q, limit)
+    return {"blogs": blogs}
 
 
+# 블로그 내보내기
+@router.get("/export", summary="블로그 내보내기 (NDJSON)")
+async def export_blogs_route(
+    include_deleted: bool = False,
+    admin: CurrentUser = Depends(get_admin_user),
+):
+    async def body():
+        # 응답 스트리밍이 끝날 때까지 유지되어야 하므로 요청 의존성과 별도의 세션 사용
+        async with AsyncSessionLocal() as db:
+            async for chunk in export_blogs_ndjson(db, include_deleted):
+                yield chunk
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+# 블로그 가져오기
+@router.post("/import", summary="블로그 가져오기 (NDJSON)")
+async def import_blogs_route(
+    request: Request,
+    admin: CurrentUser = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    report = await import_blogs_ndjson(db, request.stream())
+    return JSONResponse(content=report, status_code=200)
+
+# 아카이브된 블로그 복원 (관리자)
+@router.post("/archive/{blog_id}/restore", summary="아카이브된 블로그 복원")
+async def restore_blog_route(
+    blog_id: int,
+    admin: CurrentUser = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    blog = await restore_blog(db, blog_id)
+    return JSONResponse(content={"message": "블로그가 복원되었습니다", "blog": blog.title}, status_code=200)
+
+
+# 블로그 일괄 생성/수정/삭제 (오프라인 편집 동기화용)
+@router.post("/batch", summary="블로그 일괄 변경", response_model=BlogBatchResult)
+async def batch_blogs_route(
+    batch: BlogBatch,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    result = await apply_blog_batch(db, batch, user.id)
+    if batch.atomic and not result["applied"]:
+        # 전체가 롤백된 atomic 배치는 배치 단위로 실패 상태 반환
+        return JSONResponse(content=result, status_code=409)
+    return result
+
+# 블로그 단건 조회 (고정 경로 라우트들보다 뒤에 선언해야 /id, /search 등과 겹치지 않음)
+@router.get("/{blog_id}", summary="블로그 단건 조회", responses={200: {"model": BlogDetail}})
+async def get_blog_route(
+    request: Request,
+    blog_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    cached = blog_cache.get(blog_id)
+    if cached is None:
+        blog = await get_blog_detail(db, blog_id)
+        if blog is None:
+            raise HTTPException(status_code=404, detail="블로그가 없습니다.")
+        cached = CachedBlog(blog["userId"], build_cached_response(blog, blog["updatedAt"]))
+        blog_cache.set(blog_id, cached)
+    record_view(blog_id)  # 조회수는 메모리에 모았다가 주기적으로 반영
+    return conditional_response(request, cached.response, "no-cache")
 # 블로그 수정
 @router.patch("/{blog_id}", summary="블로그 수정")
 async def update_blog_route(
     blog_id: int,
     blog_data: BlogBase,
-    Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    email = Authorize.get_jwt_subject()
-    user = db.query(User).filter(User.email == email).first()  # 이메일로 유저 조회
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
-    
-    updated_blog = update_blog(db, blog_id, blog_data, user.id)  # user.id를 사용
+    updated_blog = await update_blog(db, blog_id, blog_data, user.id)  # user.id를 사용
     if not updated_blog:
         raise HTTPException(status_code=404, detail="블로그를 수정할 수 없습니다.")
     
@@ -80,16 +160,10 @@ async def update_blog_route(
 @router.delete("/{blog_id}", summary="블로그 삭제")
 async def delete_blog_route(
     blog_id: int,
-    Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    email = Authorize.get_jwt_subject()
-    user = db.query(User).filter(User.email == email).first()  # 이메일로 유저 조회
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
-    
-    success = delete_blog(db, blog_id, user.id)  # user.id로 삭제
+    success = await delete_blog(db, blog_id, user.id)  # user.id로 삭제
     if not success:
         raise HTTPException(status_code=404, detail="블로그를 삭제할 수 없습니다.")
     
@@ -1,6 +1,74 @@
-from pydantic import BaseModel
-from datetime import timedelta
+from pydantic import BaseModel, Field, model_validator
+from datetime import timedelta, datetime
+from typing import List, Literal, Optional
+from app.configs import BLOG_BATCH_MAX_OPERATIONS
 
 class BlogBase(BaseModel):
     title: str
-    content: str
\ No newline at end of file
+    content: str
+
+class AuthorSummary(BaseModel):
+    nickname: str
+    profileUrl: Optional[str] = None
+
+class BlogSummary(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    author: Optional[AuthorSummary] = None
+    createdAt: datetime
+
+class BlogDetail(BaseModel):
+    id: int
+    title: str
+    content: str
+    author: Optional[AuthorSummary] = None
+    userId: Optional[int] = None
+    viewCount: int
+    createdAt: datetime
+    updatedAt: datetime
+
+class BlogSummaryPage(BaseModel):
+    blogs: List[BlogSummary]
+    next_cursor: Optional[str] = None
+
+class BlogSearchResult(BaseModel):
+    blogs: List[BlogSummary]
+
+class BlogImport(BaseModel):
+    id: Optional[int] = None
+    title: str
+    content: str
+    userId: Optional[int] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
+    isDeleted: bool = False
+    viewCount: int = 0
+
+class BlogOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.op in ("update", "delete") and self.id is None:
+            raise ValueError(f"{self.op} 작업에는 id가 필요합니다.")
+        if self.op in ("create", "update") and (self.title is None or self.content is None):
+            raise ValueError(f"{self.op} 작업에는 title과 content가 필요합니다.")
+        return self
+
+class BlogBatch(BaseModel):
+    operations: List[BlogOperation] = Field(min_length=1, max_length=BLOG_BATCH_MAX_OPERATIONS)
+    atomic: bool = False  # True면 한 작업이라도 실패할 때 전체를 적용하지 않음
+
+class BlogOperationResult(BaseModel):
+    op: str
+    id: Optional[int] = None
+    status: int
+    detail: Optional[str] = None
+
+class BlogBatchResult(BaseModel):
+    applied: bool
+    results: List[BlogOperationResult]
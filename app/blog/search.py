@@ -0,0 +1,174 @@
+import asyncio
+import heapq
+import math
+import os
+import pickle
+import re
+import tempfile
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlmodel import select
+from app.models import Blog
+from app.configs import SEARCH_INDEX_PATH, SEARCH_REFRESH_SECONDS, SEARCH_SYNC_OVERLAP_SECONDS
+from app.logger import logger
+
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+HANGUL_PATTERN = re.compile(r"[가-힣]+")
+TITLE_WEIGHT = 2
+SNAPSHOT_VERSION = 2
+
+def tokenize(text: str) -> List[str]:
+    """
+    한글은 형태소 분석기 없이도 조사·어미 변화에 강한 음절 bigram으로, 그 외는 소문자 단어로 분리
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if HANGUL_PATTERN.fullmatch(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+class InvertedIndex:
+    """
+    BM25 랭킹을 지원하는 프로세스 내 역색인 (글 단위 추가/삭제 가능)
+    """
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self.total_length = 0
+        self.watermark: Optional[datetime] = None  # DB 동기화로 읽은 최대 updatedAt (로컬 쓰기는 반영하지 않음)
+        self.synced: Dict[int, datetime] = {}  # 겹침 구간에서 이미 동기화한 글 id -> updatedAt
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: int, title: str, content: str):
+        self.remove(doc_id)
+        counts = Counter(tokenize(content))
+        for token in tokenize(title):
+            counts[token] += TITLE_WEIGHT
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        length = sum(counts.values())
+        self.doc_lengths[doc_id] = length
+        self.doc_terms[doc_id] = tuple(counts)
+        self.total_length += length
+
+    def remove(self, doc_id: int):
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        doc_count = len(self.doc_lengths)
+        if not doc_count:
+            return []
+        avg_length = self.total_length / doc_count
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, tf in docs.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def apply(self, blog: Blog):
+        """
+        글 한 건의 현재 상태를 인덱스에 반영
+        """
+        if blog.isDeleted:
+            self.remove(blog.id)
+        else:
+            self.add(blog.id, blog.title, blog.content)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 여러 워커가 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 프로세스별 임시 파일에 쓴 뒤 교체
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path) or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                pickle.dump((SNAPSHOT_VERSION, self.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                f.close()
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        # 서버가 직접 기록한 로컬 스냅샷만 읽음
+        try:
+            with open(path, "rb") as f:
+                version, state = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"검색 인덱스 스냅샷을 읽을 수 없습니다: {e}")
+            return False
+        if version != SNAPSHOT_VERSION:
+            return False
+        self.__dict__.update(state)
+        return True
+
+search_index = InvertedIndex()
+
+async def sync_search_index(db):
+    """
+    watermark 이후 변경된 글(삭제 포함)만 DB에서 읽어 반영
+    다른 워커가 더 이른 updatedAt으로 늦게 커밋한 글을 놓치지 않도록 SEARCH_SYNC_OVERLAP_SECONDS만큼 겹쳐 읽고,
+    겹친 구간에서 이미 같은 updatedAt으로 반영한 글은 건너뜀
+    """
+    overlap = timedelta(seconds=SEARCH_SYNC_OVERLAP_SECONDS)
+    statement = select(Blog)
+    if search_index.watermark is not None:
+        statement = statement.where(Blog.updatedAt >= search_index.watermark - overlap)
+    else:
+        statement = statement.where(Blog.isDeleted == False)
+    newest = search_index.watermark
+    synced = search_index.synced
+    result = await db.stream(statement.execution_options(yield_per=1000))
+    async for blog in result.scalars():
+        if synced.get(blog.id) != blog.updatedAt:
+            search_index.apply(blog)
+            synced[blog.id] = blog.updatedAt
+        if newest is None or blog.updatedAt > newest:
+            newest = blog.updatedAt
+    search_index.watermark = newest
+    if newest is not None:
+        # 다음 동기화의 겹침 구간에 들어오는 글만 기억
+        search_index.synced = {blog_id: updated_at for blog_id, updated_at in synced.items() if updated_at >= newest - overlap}
+
+async def load_search_index(db):
+    """
+    기동 시 스냅샷을 불러온 뒤 그 이후 변경분만 DB에서 반영 (스냅샷이 없으면 전체 구성)
+    """
+    search_index.load(SEARCH_INDEX_PATH)
+    await sync_search_index(db)
+    logger.info(f"검색 인덱스 준비 완료: {len(search_index)}건")
+
+def save_search_index():
+    search_index.save(SEARCH_INDEX_PATH)
+
+async def refresh_search_index_periodically(session_factory):
+    while True:
+        await asyncio.sleep(SEARCH_REFRESH_SECONDS)
+        try:
+            async with session_factory() as db:
+                await sync_search_index(db)
+        except Exception as e:
+            logger.error(f"검색 인덱스 갱신 실패: {e}")
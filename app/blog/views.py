@@ -0,0 +1,43 @@
+import asyncio
+from collections import Counter
+from sqlalchemy import update, bindparam
+from app.models import Blog
+from app.configs import BLOG_VIEW_FLUSH_SECONDS
+from app.logger import logger
+
+# blog_id -> 아직 DB에 반영하지 않은 조회수
+_pending_views = Counter()
+
+def record_view(blog_id: int):
+    _pending_views[blog_id] += 1
+
+async def flush_view_counts(db) -> int:
+    """
+    모아둔 조회수를 executemany UPDATE 한 번으로 반영 (실패하면 다음 주기에 다시 시도)
+    """
+    global _pending_views
+    if not _pending_views:
+        return 0
+    pending, _pending_views = _pending_views, Counter()
+    statement = (
+        update(Blog.__table__)
+        .where(Blog.__table__.c.id == bindparam("blog_id"))
+        .values(viewCount=Blog.__table__.c.viewCount + bindparam("views"))
+    )
+    try:
+        await db.execute(statement, [{"blog_id": blog_id, "views": views} for blog_id, views in pending.items()])
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        _pending_views.update(pending)
+        raise
+    return len(pending)
+
+async def flush_view_counts_periodically(session_factory):
+    while True:
+        await asyncio.sleep(BLOG_VIEW_FLUSH_SECONDS)
+        try:
+            async with session_factory() as db:
+                await flush_view_counts(db)
+        except Exception as e:
+            logger.error(f"조회수 반영 실패: {e}")
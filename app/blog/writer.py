@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from fastapi import HTTPException, status
+from sqlmodel import select
+from app.models import Blog
+from app.blog.schemas import BlogBase
+from app.blog.cache import invalidate_blog_lists, invalidate_blog
+from app.blog.search import search_index
+from app.configs import BLOG_WRITE_BATCH_WINDOW_MS, BLOG_WRITE_BATCH_MAX, BLOG_WRITE_QUEUE_SIZE
+from app.logger import logger
+
+class PendingWrite(NamedTuple):
+    kind: str  # "create" | "update"
+    blog_id: Optional[int]
+    blog_data: BlogBase
+    user_id: int
+    future: asyncio.Future
+
+class GroupCommitWriter:
+    """
+    짧은 시간 안에 들어온 글 생성/수정을 모아 한 트랜잭션으로 커밋하는 write-behind 큐
+    각 요청은 자신의 Blog(또는 수정 대상이 없으면 None)나 자신의 예외를 받음
+    """
+    def __init__(self, window_ms: int, batch_max: int, queue_size: int):
+        self.window = window_ms / 1000
+        self.batch_max = batch_max
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory):
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        새 요청은 받지 않고 대기 중인 쓰기를 모두 커밋한 뒤 종료
+        """
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        await self._queue.join()
+        task.cancel()
+
+    async def submit(self, kind: str, blog_data: BlogBase, user_id: int, blog_id: Optional[int] = None) -> Optional[Blog]:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(PendingWrite(kind, blog_id, blog_data, user_id, future))
+        except asyncio.QueueFull:
+            logger.warning(f"글 쓰기 대기열 초과: {self._queue.qsize()}건 대기 중")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # 첫 요청 이후 window 동안 들어온 요청까지 한 번에 커밋
+            await asyncio.sleep(self.window)
+            while len(batch) < self.batch_max and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.error(f"글 묶음 쓰기 실패: {e}")
+                for write in batch:
+                    if not write.future.done():
+                        write.future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _apply(self, db, batch: List[PendingWrite]) -> List[Optional[Blog]]:
+        update_ids = {write.blog_id for write in batch if write.kind == "update"}
+        blogs = {}
+        if update_ids:
+            # 수정 대상은 IN 조회 한 번으로 가져오고 소유자 확인은 요청별로
+            statement = select(Blog).where(Blog.id.in_(update_ids), Blog.isDeleted == False)
+            blogs = {blog.id: blog for blog in (await db.exec(statement)).all()}
+
+        results = []
+        for write in batch:
+            if write.kind == "create":
+                blog = Blog(
+                    title=write.blog_data.title,
+                    content=write.blog_data.content,
+                    userId=write.user_id,
+                    createdAt=datetime.now()
+                )
+                db.add(blog)
+            else:
+                blog = blogs.get(write.blog_id)
+                if blog is None or blog.userId != write.user_id:
+                    blog = None
+                else:
+                    blog.title = write.blog_data.title
+                    blog.content = write.blog_data.content
+                    blog.updatedAt = datetime.now()
+            results.append(blog)
+        await db.flush()  # 생성된 글의 id 할당
+        return results
+
+    async def _flush(self, batch: List[PendingWrite]):
+        async with self._session_factory() as db:
+            try:
+                results = await self._apply(db, batch)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f"글 묶음 커밋 실패, 한 건씩 재시도: {e}")
+                results = None
+        if results is not None:
+            for write, blog in zip(batch, results):
+                self._complete(write, blog)
+            return
+
+        # 한 건의 오류가 같은 묶음의 다른 요청까지 실패시키지 않도록 개별 트랜잭션으로 재시도
+        for write in batch:
+            async with self._session_factory() as db:
+                try:
+                    blog = (await self._apply(db, [write]))[0]
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    if not write.future.done():
+                        write.future.set_exception(e)
+                    continue
+            self._complete(write, blog)
+
+    def _complete(self, write: PendingWrite, blog: Optional[Blog]):
+        if blog is not None:
+            invalidate_blog_lists(write.user_id)
+            invalidate_blog(blog.id)
+            search_index.apply(blog)
+        if not write.future.done():
+            write.future.set_result(blog)
+
+blog_writer = GroupCommitWriter(BLOG_WRITE_BATCH_WINDOW_MS, BLOG_WRITE_BATCH_MAX, BLOG_WRITE_QUEUE_SIZE)
@@ -1,31 +1,146 @@
-from botocore.exceptions import NoCredentialsError
 from fastapi import UploadFile, HTTPException
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from app.bucket.s3_client import client_s3  # 분리한 S3 클라이언트 불러오기
+from app.bucket.s3_client import get_s3_client, get_transfer_config  # 분리한 S3 클라이언트 불러오기
+from app.configs import S3_BUCKET_NAME, S3_UPLOAD_CONCURRENCY, S3_PRESIGNED_EXPIRE_SECONDS, PROFILE_IMAGE_MAX_BYTES
 
-async def upload_file_to_s3(file: UploadFile) -> str:
+# 블로킹 boto3 호출 전용 스레드 풀 (워커 수 = 동시 업로드 상한)
+s3_executor = ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY, thread_name_prefix="s3")
+
+_bucket_location = None
+
+def get_bucket_location() -> str:
+    """
+    버킷 리전은 바뀌지 않으므로 최초 1회만 조회해 캐싱
+    """
+    global _bucket_location
+    if _bucket_location is None:
+        # us-east-1 버킷은 LocationConstraint가 None으로 반환됨
+        _bucket_location = get_s3_client().get_bucket_location(Bucket=S3_BUCKET_NAME)['LocationConstraint'] or "us-east-1"
+    return _bucket_location
+
+def get_object_url(file_name: str) -> str:
+    return f"https://{S3_BUCKET_NAME}.s3-{get_bucket_location()}.amazonaws.com/{file_name}"
+
+async def get_object_url_async(file_name: str) -> str:
+    """
+    첫 호출은 get_bucket_location(블로킹 S3 호출)을 하므로 이벤트 루프 밖에서 실행
+    """
+    from botocore.exceptions import NoCredentialsError, ClientError
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(s3_executor, get_object_url, file_name)
+    except NoCredentialsError:
+        logging.error("AWS 자격 증명이 제공되지 않았습니다.")
+        raise HTTPException(status_code=500, detail="AWS 자격 증명이 제공되지 않았습니다.")
+    except ClientError as e:
+        logging.error(f"오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"오류 발생: {str(e)}")
+
+class UploadTooLarge(Exception):
+    pass
+
+class LimitedReader:
+    """
+    읽은 바이트가 max_bytes를 넘는 순간 중단하는 파일 래퍼
+    크기를 모르는 스트림도 끝까지 읽거나 버퍼링하지 않고 거절 (진행 중인 멀티파트 업로드는 boto3가 중단)
+    """
+    def __init__(self, fileobj, max_bytes: int):
+        self.fileobj = fileobj
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.fileobj.read(size)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_bytes:
+            raise UploadTooLarge()
+        return chunk
+
+def _upload_fileobj(fileobj, file_name: str, content_type: str) -> str:
+    get_s3_client().upload_fileobj(
+        fileobj,
+        S3_BUCKET_NAME,
+        file_name,
+        ExtraArgs={
+            "ContentType": content_type
+        },
+        Config=get_transfer_config(),
+    )
+    return get_object_url(file_name)
+
+async def upload_file_to_s3(file: UploadFile, max_bytes: int = PROFILE_IMAGE_MAX_BYTES) -> str:
+    from botocore.exceptions import NoCredentialsError  # botocore는 get_s3_client와 같이 처음 쓰일 때 import
+
+    # 크기를 알 수 있으면 S3 호출 없이 바로 거절
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="파일 크기가 너무 큽니다.")
     try:
         file_name = f"{datetime.now().isoformat()}-{file.filename}"
         content_type = file.content_type
 
-        # 파일을 S3에 업로드
-        client_s3.upload_fileobj(
-            file.file,
-            "profileuserbucket",  # 버킷 이름을 직접 지정
-            file_name,
-            ExtraArgs={
-                "ContentType": content_type
-            }
-        )
-
-        # S3 파일 URL 생성
-        location = client_s3.get_bucket_location(Bucket="profileuserbucket")['LocationConstraint']
-        url = f"https://profileuserbucket.s3-{location}.amazonaws.com/{file_name}"
-        return url
+        # 파일을 S3에 업로드 (이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+        loop = asyncio.get_running_loop()
+        reader = LimitedReader(file.file, max_bytes)
+        return await loop.run_in_executor(s3_executor, _upload_fileobj, reader, file_name, content_type)
+    except UploadTooLarge:
+        raise HTTPException(status_code=413, detail="파일 크기가 너무 큽니다.")
     except NoCredentialsError:
         logging.error("AWS 자격 증명이 제공되지 않았습니다.")
         raise HTTPException(status_code=500, detail="AWS 자격 증명이 제공되지 않았습니다.")
     except Exception as e:
         logging.error(f"오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"오류 발생: {str(e)}")
+
+def _create_presigned_post(key: str, content_type: str, max_bytes: int) -> dict:
+    return get_s3_client().generate_presigned_post(
+        S3_BUCKET_NAME,
+        key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, max_bytes],
+        ],
+        ExpiresIn=S3_PRESIGNED_EXPIRE_SECONDS,
+    )
+
+def _create_presigned_put(key: str, content_type: str) -> str:
+    return get_s3_client().generate_presigned_url(
+        "put_object",
+        Params={"Bucket": S3_BUCKET_NAME, "Key": key, "ContentType": content_type},
+        ExpiresIn=S3_PRESIGNED_EXPIRE_SECONDS,
+    )
+
+async def create_presigned_upload(key: str, content_type: str, max_bytes: int) -> dict:
+    """
+    클라이언트가 버킷에 직접 업로드할 presigned POST/PUT 발급
+    POST는 크기·타입 조건을 S3가 강제하고, PUT은 Content-Type만 서명에 포함되므로 confirm 단계에서 크기를 다시 검사
+    """
+    from botocore.exceptions import NoCredentialsError
+    try:
+        loop = asyncio.get_running_loop()
+        post = await loop.run_in_executor(s3_executor, _create_presigned_post, key, content_type, max_bytes)
+        put_url = await loop.run_in_executor(s3_executor, _create_presigned_put, key, content_type)
+        return {"key": key, "post": post, "put_url": put_url, "expires_in": S3_PRESIGNED_EXPIRE_SECONDS}
+    except NoCredentialsError:
+        logging.error("AWS 자격 증명이 제공되지 않았습니다.")
+        raise HTTPException(status_code=500, detail="AWS 자격 증명이 제공되지 않았습니다.")
+
+async def head_uploaded_object(key: str):
+    """
+    업로드된 객체의 메타데이터 조회, 없으면 None
+    """
+    from botocore.exceptions import NoCredentialsError, ClientError
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(s3_executor, lambda: get_s3_client().head_object(Bucket=S3_BUCKET_NAME, Key=key))
+    except NoCredentialsError:
+        logging.error("AWS 자격 증명이 제공되지 않았습니다.")
+        raise HTTPException(status_code=500, detail="AWS 자격 증명이 제공되지 않았습니다.")
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        logging.error(f"오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"오류 발생: {str(e)}")
@@ -1,9 +1,50 @@
 # s3_client.py
-import boto3
-from app.configs import CREDENTIALS_ACCESS_KEY, CREDENTIALS_SECRET_KEY
-
-client_s3 = boto3.client(
-    's3',
-    aws_access_key_id=CREDENTIALS_ACCESS_KEY,
-    aws_secret_access_key=CREDENTIALS_SECRET_KEY,
-)
+# boto3 import와 클라이언트 생성(엔드포인트/서비스 모델 로딩)은 무거우므로 처음 쓰일 때 수행
+import threading
+from app.metrics import instrument_s3_client
+from app.configs import CREDENTIALS_ACCESS_KEY, CREDENTIALS_SECRET_KEY, S3_MAX_POOL_CONNECTIONS, S3_MULTIPART_CHUNK_MB
+
+MB = 1024 * 1024
+
+_client_s3 = None
+_transfer_config = None
+# s3_executor 스레드들이 동시에 처음 호출해도 클라이언트는 하나만 생성
+_client_lock = threading.Lock()
+
+def get_s3_client():
+    global _client_s3
+    if _client_s3 is not None:
+        return _client_s3
+    with _client_lock:
+        if _client_s3 is not None:
+            return _client_s3
+        import boto3
+        from botocore.config import Config
+
+        client_s3 = boto3.client(
+            's3',
+            aws_access_key_id=CREDENTIALS_ACCESS_KEY,
+            aws_secret_access_key=CREDENTIALS_SECRET_KEY,
+            config=Config(
+                max_pool_connections=S3_MAX_POOL_CONNECTIONS,  # 동시 업로드/멀티파트 스레드가 커넥션을 기다리지 않도록
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        )
+        instrument_s3_client(client_s3)
+        _client_s3 = client_s3
+        return _client_s3
+
+def get_transfer_config():
+    global _transfer_config
+    if _transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+
+        # 파트 크기 이상인 파일은 청크 단위 멀티파트 업로드로 스트리밍
+        _transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_CHUNK_MB * MB,
+            multipart_chunksize=S3_MULTIPART_CHUNK_MB * MB,
+            max_concurrency=4,
+            use_threads=True,
+        )
+    return _transfer_config
@@ -0,0 +1,164 @@
+import gzip
+from typing import Callable, Dict, Optional
+from app.cache import TTLCache
+from app.configs import (
+    COMPRESSION_MIN_SIZE, COMPRESSION_ENCODINGS, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_ZSTD_LEVEL, COMPRESSION_CACHE_SIZE, COMPRESSION_CACHE_TTL,
+)
+
+try:
+    import brotli
+except ImportError:  # 설치되지 않은 환경에서는 해당 인코딩만 제외
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+def compressors(gzip_level: int, brotli_quality: int, zstd_level: int) -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    사용 가능한 인코딩 -> 압축 함수 (mtime을 고정해 같은 본문이면 같은 바이트가 나오도록)
+    """
+    available = {"gzip": lambda body: gzip.compress(body, compresslevel=gzip_level, mtime=0)}
+    if brotli is not None:
+        available["br"] = lambda body: brotli.compress(body, quality=brotli_quality)
+    if zstandard is not None:
+        zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+        available["zstd"] = zstd_compressor.compress
+    return available
+
+def choose_encoding(accept_encoding: str, preferred: list) -> Optional[str]:
+    """
+    Accept-Encoding에서 q>0으로 허용된 인코딩 중 서버 선호 순서로 첫 번째 선택
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding in preferred:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+# (ETag, 인코딩) -> 압축된 본문
+# 강한 ETag는 본문 바이트의 해시이므로 같은 목록을 다시 읽을 때 직렬화와 압축을 모두 건너뜀
+compressed_cache = TTLCache(maxsize=COMPRESSION_CACHE_SIZE, ttl=COMPRESSION_CACHE_TTL)
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상으로 zstd/br/gzip 압축 (작은 응답, 이미 인코딩된 응답, 스트리밍 응답은 그대로 전달)
+    """
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors = compressors(COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY, COMPRESSION_ZSTD_LEVEL)
+        self.preferred = [encoding for encoding in COMPRESSION_ENCODINGS if encoding in self.compressors]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding, self.preferred) if accept_encoding else None
+        if encoding is None:
+            # 압축하지 않아도 같은 URL이 Accept-Encoding에 따라 달라질 수 있음을 캐시에 알림 (ETag는 강한 그대로)
+            async def send_identity(message):
+                if message["type"] == "http.response.start":
+                    headers = dict(message.get("headers", []))
+                    if self._varies(message["status"], headers):
+                        message = {**message, "headers": self._encoded_headers(message, headers, None, weak_etag=False)}
+                await send(message)
+
+            await self.app(scope, receive, send_identity)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = dict(start_message.get("headers", []))
+            if (
+                start_message["status"] == 304
+                or message.get("more_body", False)  # 스트리밍 응답(내보내기 등)은 버퍼링하지 않음
+                or len(body) < self.minimum_size
+                or not self._varies(start_message["status"], headers)
+            ):
+                passthrough = True
+                if self._varies(start_message["status"], headers):
+                    # 압축하지 않은 작은 응답과 304도 압축 응답과 같은 약한 ETag와 Vary를 가져야
+                    # 같은 본문의 200/304가 서로 다른 ETag로 보이지 않고 캐시가 표현을 구분함
+                    start_message = {**start_message, "headers": self._encoded_headers(start_message, headers, None)}
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = headers.get(b"etag")
+            compressed = None
+            if etag is not None and not etag.startswith(b"W/"):
+                compressed = compressed_cache.get((etag, encoding))
+            if compressed is None:
+                compressed = self.compressors[encoding](body)
+                if etag is not None and not etag.startswith(b"W/"):
+                    compressed_cache.set((etag, encoding), compressed)
+
+            raw_headers = self._encoded_headers(start_message, headers, [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+            ])
+            await send({**start_message, "headers": raw_headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _varies(status: int, headers: dict) -> bool:
+        """
+        Accept-Encoding에 따라 압축될 수 있는 응답인지 (304는 본문 헤더가 없으므로 조건부 응답을 하는 JSON 라우트로 간주)
+        """
+        if b"content-encoding" in headers:
+            return False
+        if status == 304 and b"content-type" not in headers:
+            return True
+        return headers.get(b"content-type", b"").decode("latin-1").startswith(COMPRESSIBLE_TYPES)
+
+    @staticmethod
+    def _encoded_headers(start_message, headers: dict, extra: Optional[list], weak_etag: bool = True) -> list:
+        raw_headers = [
+            (name, value) for name, value in start_message.get("headers", [])
+            if name not in (b"content-length", b"etag", b"vary")
+        ]
+        raw_headers += extra or []
+        if b"content-length" in headers and extra is None:
+            raw_headers.append((b"content-length", headers[b"content-length"]))
+        vary = headers.get(b"vary")
+        raw_headers.append((b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding"))
+        etag = headers.get(b"etag")
+        if etag is not None:
+            # 인코딩별로 바이트가 다르므로 약한 ETag로 바꿔 전달 (If-None-Match는 약한 비교로 처리)
+            raw_headers.append((b"etag", etag if etag.startswith(b"W/") or not weak_etag else b"W/" + etag))
+        return raw_headers
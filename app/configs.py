@@ -5,9 +5,98 @@ load_dotenv()
 
 DATABASE_URL = os.environ.get("LOCAL_DATABASE_URL")  # 서버 로컬로 실행할 시의 DB 연동 URL
 # DATABASE_URL = os.environ.get("DATABASE_URL")  
+ASYNC_DATABASE_URL = os.environ.get("ASYNC_DATABASE_URL")  # 비어 있으면 DATABASE_URL에서 비동기 드라이버 URL을 유도
 JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
 JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM')
 JWT_ACCESS_EXPIRE_MINUTES = int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRE_MINUTES'))
 JWT_REFRESH_EXPIRE_DAYS = int(os.environ.get('JWT_REFRESH_TOKEN_EXPIRE_DAYS'))
 CREDENTIALS_ACCESS_KEY = os.getenv("CREDENTIALS_ACCESS_KEY")
-CREDENTIALS_SECRET_KEY = os.getenv("CREDENTIALS_SECRET_KEY")
\ No newline at end of file
+CREDENTIALS_SECRET_KEY = os.getenv("CREDENTIALS_SECRET_KEY")
+BLOG_PAGE_DEFAULT_LIMIT = int(os.environ.get('BLOG_PAGE_DEFAULT_LIMIT', 20))  # 블로그 목록 기본 페이지 크기
+BLOG_PAGE_MAX_LIMIT = int(os.environ.get('BLOG_PAGE_MAX_LIMIT', 100))  # 블로그 목록 최대 페이지 크기
+
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))  # bcrypt 전용 프로세스 풀 크기
+PASSWORD_HASH_QUEUE_SIZE = int(os.environ.get('PASSWORD_HASH_QUEUE_SIZE', 32))  # 풀이 바쁠 때 대기 가능한 요청 수
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))  # 보정을 하지 않을 때 사용할 bcrypt cost
+BCRYPT_TARGET_MS = int(os.environ.get('BCRYPT_TARGET_MS', 0))  # 0보다 크면 기동 시 해시 1회가 이 시간(ms)에 가깝도록 cost 보정
+
+CURRENT_USER_CACHE_SIZE = int(os.environ.get('CURRENT_USER_CACHE_SIZE', 10000))  # 로그인 유저 캐시 최대 항목 수
+CURRENT_USER_CACHE_TTL = int(os.environ.get('CURRENT_USER_CACHE_TTL', 60))  # 로그인 유저 캐시 유효 시간(초)
+
+USER_FILTER_CAPACITY = int(os.environ.get('USER_FILTER_CAPACITY', 1000000))  # 이메일/닉네임 블룸 필터 예상 항목 수
+USER_FILTER_ERROR_RATE = float(os.environ.get('USER_FILTER_ERROR_RATE', 0.01))  # 블룸 필터 거짓 양성 비율
+USER_INDEX_REFRESH_SECONDS = int(os.environ.get('USER_INDEX_REFRESH_SECONDS', 30))  # 다른 워커의 가입/탈퇴/닉네임 변경을 DB에서 반영하는 주기(초)
+USER_INDEX_SYNC_OVERLAP_SECONDS = int(os.environ.get('USER_INDEX_SYNC_OVERLAP_SECONDS', 60))  # 늦게 커밋된 변경을 놓치지 않도록 watermark보다 앞서 다시 읽는 구간(초)
+USER_INDEX_REBUILD_SECONDS = int(os.environ.get('USER_INDEX_REBUILD_SECONDS', 3600))  # 블룸 필터/닉네임 인덱스 전체 재구성 주기(초, 0이면 기동 시에만)
+NICKNAME_SUGGEST_DEFAULT_LIMIT = int(os.environ.get('NICKNAME_SUGGEST_DEFAULT_LIMIT', 10))  # 닉네임 자동완성 기본 결과 수
+NICKNAME_SUGGEST_MAX_LIMIT = int(os.environ.get('NICKNAME_SUGGEST_MAX_LIMIT', 50))  # 닉네임 자동완성 최대 결과 수
+
+S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "profileuserbucket")
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", 50))  # boto3 HTTP 커넥션 풀 크기
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", 8))  # 동시에 진행할 업로드 수
+S3_MULTIPART_CHUNK_MB = int(os.getenv("S3_MULTIPART_CHUNK_MB", 8))  # 멀티파트 업로드 파트 크기(MB)
+S3_PRESIGNED_EXPIRE_SECONDS = int(os.getenv("S3_PRESIGNED_EXPIRE_SECONDS", 300))  # presigned 업로드 URL 유효 시간(초)
+PROFILE_IMAGE_MAX_BYTES = int(os.getenv("PROFILE_IMAGE_MAX_BYTES", 5 * 1024 * 1024))  # 프로필 이미지 최대 크기
+PROFILE_IMAGE_CONTENT_TYPES = os.getenv("PROFILE_IMAGE_CONTENT_TYPES", "image/jpeg,image/png,image/gif,image/webp").split(",")
+
+BLOG_LIST_CACHE_SIZE = int(os.environ.get('BLOG_LIST_CACHE_SIZE', 1000))  # 블로그 목록 응답 캐시 최대 항목 수
+BLOG_LIST_CACHE_TTL = int(os.environ.get('BLOG_LIST_CACHE_TTL', 5))  # 다른 워커의 변경이 반영되기까지의 최대 지연(초)
+BLOG_CACHE_SIZE = int(os.environ.get('BLOG_CACHE_SIZE', 10000))  # 단건 조회 응답 캐시 최대 글 수
+BLOG_CACHE_TTL = int(os.environ.get('BLOG_CACHE_TTL', 30))  # 다른 워커의 수정/삭제가 반영되기까지의 최대 지연(초)
+BLOG_VIEW_FLUSH_SECONDS = int(os.environ.get('BLOG_VIEW_FLUSH_SECONDS', 10))  # 메모리에 모은 조회수를 DB에 반영하는 주기(초)
+
+SEARCH_INDEX_PATH = os.environ.get('SEARCH_INDEX_PATH', 'data/search_index.pkl')  # 검색 인덱스 스냅샷 파일 경로
+SEARCH_REFRESH_SECONDS = int(os.environ.get('SEARCH_REFRESH_SECONDS', 30))  # 다른 워커의 변경을 DB에서 반영하는 주기(초)
+SEARCH_SYNC_OVERLAP_SECONDS = int(os.environ.get('SEARCH_SYNC_OVERLAP_SECONDS', 60))  # 늦게 커밋된 글을 놓치지 않도록 watermark보다 앞서 다시 읽는 구간(초)
+SEARCH_MAX_LIMIT = int(os.environ.get('SEARCH_MAX_LIMIT', 50))  # 검색 결과 최대 개수
+BLOG_EXCERPT_LENGTH = int(os.environ.get('BLOG_EXCERPT_LENGTH', 200))  # 목록 응답에 포함할 본문 요약 길이(글자 수)
+
+ADMIN_EMAILS = [email.strip() for email in os.environ.get('ADMIN_EMAILS', '').split(',') if email.strip()]  # 관리자 API를 호출할 수 있는 계정
+BLOG_EXPORT_FETCH_SIZE = int(os.environ.get('BLOG_EXPORT_FETCH_SIZE', 1000))  # 내보내기 시 서버 사이드 커서에서 한 번에 가져올 행 수
+BLOG_IMPORT_BATCH_SIZE = int(os.environ.get('BLOG_IMPORT_BATCH_SIZE', 1000))  # 가져오기 시 한 트랜잭션에 넣을 행 수
+BLOG_BATCH_MAX_OPERATIONS = int(os.environ.get('BLOG_BATCH_MAX_OPERATIONS', 100))  # 일괄 변경 요청 한 번에 허용하는 작업 수
+
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'color')  # color: 개발용 컬러 로그, json: 운영용 구조화 로그
+LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))  # 가득 차면 요청을 막지 않고 로그를 버림
+LOG_SAMPLE_RATES = os.environ.get('LOG_SAMPLE_RATES', '')  # 레벨별 기록 비율, 예: "DEBUG=0.01,INFO=0.1" (미지정 레벨은 전부 기록)
+SQL_ECHO = os.environ.get('SQL_ECHO', 'false').lower() in ('1', 'true', 'yes')  # SQL 문 로깅 여부
+
+DATABASE_REPLICA_URLS = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]  # 읽기 전용 복제본 URL 목록
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))  # 엔진별 상시 유지 커넥션 수
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))  # 풀이 가득 찼을 때 추가로 열 수 있는 커넥션 수
+DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))  # 커넥션을 기다리는 최대 시간(초)
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # MySQL wait_timeout보다 짧게 커넥션 재생성(초)
+DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')  # 체크아웃 시 끊긴 커넥션 검사
+
+DB_AUTO_CREATE_SCHEMA = os.environ.get('DB_AUTO_CREATE_SCHEMA', 'false').lower() in ('1', 'true', 'yes')  # 기동 시 스키마 생성 (로컬 개발용, 운영은 python -m app.migrate)
+STARTUP_WARMUP = os.environ.get('STARTUP_WARMUP', 'false').lower() in ('1', 'true', 'yes')  # 기동 시 DB 커넥션/S3 클라이언트 미리 준비
+DB_WARMUP_CONNECTIONS = int(os.environ.get('DB_WARMUP_CONNECTIONS', 2))  # 워밍업 시 엔진별로 미리 열어둘 커넥션 수
+
+ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', 30))  # 논리 삭제 후 아카이브 테이블로 옮기기까지의 보존 기간(일)
+ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', 500))  # 한 트랜잭션에서 옮길 행 수
+ARCHIVE_INTERVAL_SECONDS = int(os.environ.get('ARCHIVE_INTERVAL_SECONDS', 3600))  # 아카이브 작업 주기(초), 0이면 끔 (python -m app.archive로 수동 실행)
+
+BLOG_WRITE_BEHIND = os.environ.get('BLOG_WRITE_BEHIND', 'false').lower() in ('1', 'true', 'yes')  # 글 생성/수정을 모아 한 트랜잭션으로 커밋
+BLOG_WRITE_BATCH_WINDOW_MS = int(os.environ.get('BLOG_WRITE_BATCH_WINDOW_MS', 5))  # 첫 요청 이후 함께 커밋할 요청을 모으는 시간(ms)
+BLOG_WRITE_BATCH_MAX = int(os.environ.get('BLOG_WRITE_BATCH_MAX', 100))  # 한 트랜잭션에 넣을 최대 요청 수
+BLOG_WRITE_QUEUE_SIZE = int(os.environ.get('BLOG_WRITE_QUEUE_SIZE', 1000))  # 대기열 상한, 초과 시 503
+
+RATE_LIMITS = os.environ.get('RATE_LIMITS', 'POST /api/v1/users/login=10/60,POST /api/v1/users/signup=5/60,GET /api/v1/s3/test-s3=10/60')  # "메서드 경로=요청 수/초" 목록, 클라이언트(IP, JWT subject)별 토큰 버킷
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get('RATE_LIMIT_MAX_CLIENTS', 100000))  # 라우트별로 기억할 최대 클라이언트 수 (오래된 순으로 제거)
+RATE_LIMIT_TRUST_FORWARDED = os.environ.get('RATE_LIMIT_TRUST_FORWARDED', 'false').lower() in ('1', 'true', 'yes')  # 프록시 뒤에서 X-Forwarded-For의 첫 IP를 클라이언트로 사용
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', 512))  # 워커당 동시 처리 요청 상한, 초과 시 즉시 503 (0이면 끔)
+
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))  # 이보다 작은 응답은 압축하지 않음(바이트)
+COMPRESSION_ENCODINGS = [encoding.strip() for encoding in os.environ.get('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',') if encoding.strip()]  # 클라이언트가 여러 개를 허용할 때의 서버 선호 순서
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 5))
+COMPRESSION_ZSTD_LEVEL = int(os.environ.get('COMPRESSION_ZSTD_LEVEL', 3))
+COMPRESSION_CACHE_SIZE = int(os.environ.get('COMPRESSION_CACHE_SIZE', 2000))  # (ETag, 인코딩)별 압축 결과 캐시 최대 항목 수
+COMPRESSION_CACHE_TTL = int(os.environ.get('COMPRESSION_CACHE_TTL', 300))
+
+PROFILER_SAMPLE_RATE = float(os.environ.get('PROFILER_SAMPLE_RATE', 0))  # 무작위로 프로파일링할 요청 비율 (0이면 헤더로 요청한 경우만)
+PROFILER_TOKEN = os.environ.get('PROFILER_TOKEN', '')  # X-Profile 헤더에 이 값을 보내면 로그인 없이 프로파일링 (비어 있으면 관리자 토큰만 허용)
+PROFILER_DIR = os.environ.get('PROFILER_DIR', 'data/profiles')  # 프로파일 결과(pstats, SQL 목록) 저장 디렉터리
+PROFILER_MAX_FILES = int(os.environ.get('PROFILER_MAX_FILES', 50))  # 보관할 최대 프로파일 수, 초과 시 오래된 것부터 삭제
+PROFILER_MAX_STATEMENTS = int(os.environ.get('PROFILER_MAX_STATEMENTS', 500))  # 프로파일 하나에 기록할 최대 SQL 수
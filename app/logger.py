@@ -1,20 +1,91 @@
+import atexit
 import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
 import colorlog
+import orjson
+from app.configs import LOG_LEVEL, LOG_FORMAT, LOG_QUEUE_SIZE, LOG_SAMPLE_RATES, SQL_ECHO
 
-logger = logging.getLogger('')
-logger.setLevel(logging.DEBUG)
-
-formatter = colorlog.ColoredFormatter(
-    '%(log_color)s%(levelname)s:     커스텀 로그: %(message)s',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'bold_red',
-    }
-)
+class JSONFormatter(logging.Formatter):
+    """
+    한 줄에 하나의 JSON 객체로 기록하는 운영용 포맷터
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+class SamplingFilter(logging.Filter):
+    """
+    레벨별 비율만큼만 통과 (예: {"DEBUG": 0.01, "INFO": 0.1}), 지정하지 않은 레벨은 모두 통과
+    """
+    def __init__(self, rates: dict):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        return rate is None or random.random() < rate
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 요청 스레드를 막지 않고 로그를 버림
+    """
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 리스너가 처리하므로 직렬화 대비 포맷팅/복사를 생략 (포맷은 리스너 스레드에서)
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
+def parse_sample_rates(value: str) -> dict:
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        level, rate = item.split("=")
+        rates[logging.getLevelName(level.strip().upper())] = float(rate)
+    return rates
+
+if LOG_FORMAT == "json":
+    formatter = JSONFormatter()
+else:
+    formatter = colorlog.ColoredFormatter(
+        '%(log_color)s%(levelname)s:     커스텀 로그: %(message)s',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'bold_red',
+        }
+    )
+
+# 실제 출력(stream write)은 리스너 스레드에서, 요청 경로에서는 큐에 넣기만 함
 stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
\ No newline at end of file
+
+queue_handler = DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+queue_handler.addFilter(SamplingFilter(parse_sample_rates(LOG_SAMPLE_RATES)))
+listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+logger = logging.getLogger('')
+logger.setLevel(LOG_LEVEL)
+logger.addHandler(queue_handler)
+
+# SQL 로그는 engine echo(별도 동기 핸들러) 대신 같은 큐 파이프라인으로 전달
+logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO if SQL_ECHO else logging.WARNING)
@@ -1,4 +1,6 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, FileResponse
+from fastapi_another_jwt_auth.exceptions import AuthJWTException
 from fastapi.middleware.cors import CORSMiddleware
 from app import models
 from contextlib import asynccontextmanager
@@ -6,20 +8,83 @@ from app.user import routes as user_routes
 from fastapi.security import OAuth2PasswordBearer
 from app.bucket import routes as  s3_routes
 from app.blog import routes as blog_routes
+from app.user.hashing import start_password_pool, shutdown_password_pool
+from app.user.crud import load_user_filters, refresh_user_index_periodically, current_user_cache
+from app.bucket.crud import s3_executor
+from app.bucket.s3_client import get_s3_client
+from app.blog.cache import blog_list_cache, blog_cache
+from app.metrics import MetricsMiddleware, cache_collector, render_metrics
+from app.ratelimit import AdmissionMiddleware
+from app.compression import CompressionMiddleware, compressed_cache
+from app.profiling import ProfilingMiddleware, list_profiles, profile_path
+from app.user.auth import get_admin_user
+from app.user.schemas import CurrentUser
+from app.blog.search import load_search_index, save_search_index, refresh_search_index_periodically
+from app.responses import ORJSONResponse
+from app.archive import archive_deleted_rows_periodically
+from app.blog.writer import blog_writer
+from app.blog.views import flush_view_counts, flush_view_counts_periodically
+from app.logger import logger
+from app.configs import DB_AUTO_CREATE_SCHEMA, STARTUP_WARMUP, DB_WARMUP_CONNECTIONS, ARCHIVE_INTERVAL_SECONDS, BLOG_WRITE_BEHIND
+import asyncio
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    models.SQLModel.metadata.create_all(models.engine)
+    if DB_AUTO_CREATE_SCHEMA:
+        models.create_schema()
+    await start_password_pool()
+    if STARTUP_WARMUP:
+        # 첫 요청이 커넥션 수립/boto3 로딩 비용을 치르지 않도록 미리 준비
+        await models.warm_up_engines(DB_WARMUP_CONNECTIONS)
+        await asyncio.get_running_loop().run_in_executor(s3_executor, get_s3_client)
+    async with models.AsyncSessionLocal() as db:
+        await load_user_filters(db)
+        await load_search_index(db)
+    search_refresh_task = asyncio.create_task(refresh_search_index_periodically(models.AsyncSessionLocal))
+    user_refresh_task = asyncio.create_task(refresh_user_index_periodically(models.AsyncSessionLocal))
+    archive_task = None
+    if ARCHIVE_INTERVAL_SECONDS > 0:
+        archive_task = asyncio.create_task(archive_deleted_rows_periodically(models.AsyncSessionLocal))
+    view_flush_task = asyncio.create_task(flush_view_counts_periodically(models.AsyncSessionLocal))
+    if BLOG_WRITE_BEHIND:
+        blog_writer.start(models.AsyncSessionLocal)
     yield
+    # 대기 중인 글 쓰기를 먼저 커밋해야 검색 인덱스 저장/엔진 정리에 반영됨
+    await blog_writer.stop()
+    view_flush_task.cancel()
+    try:
+        async with models.AsyncSessionLocal() as db:
+            await flush_view_counts(db)
+    except Exception as e:
+        logger.error(f"종료 시 조회수 반영 실패: {e}")
+    search_refresh_task.cancel()
+    user_refresh_task.cancel()
+    if archive_task:
+        archive_task.cancel()
+    save_search_index()
+    shutdown_password_pool()
+    s3_executor.shutdown(wait=True)
+    await models.dispose_engines()
 
 # OAuth2PasswordBearer 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/token")
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 router = APIRouter(prefix="/api/v1")
 app.include_router(user_routes.router)
 app.include_router(s3_routes.router)
 app.include_router(blog_routes.router)
 
+# JWT 인증 실패 시 500 대신 라이브러리가 지정한 상태 코드로 응답
+@app.exception_handler(AuthJWTException)
+async def authjwt_exception_handler(request: Request, exc: AuthJWTException):
+    return JSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+
+# 응답 압축 (ETag가 있는 응답은 압축 결과를 캐시)
+app.add_middleware(CompressionMiddleware)
+
+# 동시 처리 상한과 비싼 라우트의 클라이언트별 처리율 제한 (CORS 안쪽에 두어 429/503 응답에도 CORS 헤더 포함)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS 설정
 origins = [
     "http://localhost",
@@ -34,6 +99,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 단위 프로파일링 (MetricsMiddleware 안쪽에 두어 요청이 실행한 SQL도 함께 기록)
+app.add_middleware(ProfilingMiddleware)
+
+# 라우트별 지연/SQL 집계 및 Server-Timing 헤더
+app.add_middleware(MetricsMiddleware)
+cache_collector.register("current_user", current_user_cache)
+cache_collector.register("blog_list", blog_list_cache)
+cache_collector.register("blog", blog_cache)
+cache_collector.register("compressed", compressed_cache)
+
+# Prometheus 수집 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+# 저장된 프로파일 목록 (관리자)
+@app.get("/api/v1/profiles", summary="요청 프로파일 목록", tags=["profiles"])
+async def get_profiles(admin: CurrentUser = Depends(get_admin_user)):
+    return await asyncio.to_thread(list_profiles)
+
+# 프로파일 pstats 파일 다운로드 (관리자)
+@app.get("/api/v1/profiles/{profile_id}", summary="요청 프로파일 다운로드", tags=["profiles"])
+async def download_profile(profile_id: str, admin: CurrentUser = Depends(get_admin_user)):
+    path = profile_path(profile_id, "pstats")
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일이 없습니다.")
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.pstats")
+
+# 프로파일 요청이 실행한 SQL 목록 (관리자)
+@app.get("/api/v1/profiles/{profile_id}/sql", summary="요청 프로파일 SQL 목록", tags=["profiles"])
+async def get_profile_sql(profile_id: str, admin: CurrentUser = Depends(get_admin_user)):
+    path = profile_path(profile_id, "json")
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일이 없습니다.")
+    return FileResponse(path, media_type="application/json")
+
 # 기본 엔드포인트
 @app.get("/")
 async def root():
@@ -0,0 +1,162 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import Counter, Histogram, CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route", "status"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 SQL 실행 수", ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "요청당 SQL 실행 시간 합계", ["route"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀에서 커넥션을 얻기까지 기다린 시간", ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+S3_LATENCY = Histogram(
+    "s3_request_duration_seconds", "S3 API 호출 시간", ["operation"],
+)
+S3_ERRORS = Counter(
+    "s3_request_errors_total", "실패한 S3 API 호출 수", ["operation"],
+)
+REQUESTS_REJECTED = Counter(
+    "http_requests_rejected_total", "처리율 제한/동시성 상한으로 거절한 요청 수", ["route", "reason"],
+)
+
+class RequestStats:
+    __slots__ = ("queries", "db_time", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.statements = None  # 프로파일링 중인 요청만 (SQL, 실행 시간) 목록을 기록
+
+# 현재 요청의 SQL 통계 (요청 밖에서 실행된 쿼리는 집계하지 않음)
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실행 단위 context에 시작 시각 기록 (실패한 SQL은 after가 호출되지 않으므로 커넥션에 쌓아두면 풀의 커넥션에 남음)
+    if context is not None:
+        context._query_start = time.perf_counter()
+    else:
+        conn.info["query_start"] = time.perf_counter()  # context 없는 내부 실행은 덮어쓰므로 쌓이지 않음
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = context._query_start if context is not None else conn.info.pop("query_start")
+    elapsed = time.perf_counter() - start
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+        if stats.statements is not None:
+            stats.statements.append((statement, elapsed))
+
+def instrument_engine(engine):
+    """
+    SQL 실행 수/시간을 현재 요청에 누적 (AsyncEngine은 sync_engine을 전달)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+def timed_pool(pool_class, name: str):
+    """
+    커넥션을 얻을 때까지의 대기 시간을 기록하는 풀 클래스 생성
+    """
+    class TimedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                DB_POOL_CHECKOUT_WAIT.labels(name).observe(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+def instrument_s3_client(client):
+    """
+    botocore 이벤트로 모든 S3 호출(멀티파트 파트 포함) 시간 기록
+    """
+    def before_call(context, **kwargs):
+        context["metrics_start"] = time.perf_counter()
+
+    def after_call(context, model, http_response, **kwargs):
+        start = context.pop("metrics_start", None)
+        if start is not None:
+            S3_LATENCY.labels(model.name).observe(time.perf_counter() - start)
+        if http_response.status_code >= 400:
+            S3_ERRORS.labels(model.name).inc()
+
+    client.meta.events.register("before-call.s3.*", before_call)
+    client.meta.events.register("after-call.s3.*", after_call)
+
+class CacheCollector:
+    """
+    프로세스 내 캐시의 크기와 hit/miss 수를 노출
+    """
+    def __init__(self):
+        self.caches = {}
+
+    def register(self, name: str, cache):
+        self.caches[name] = cache
+
+    def collect(self):
+        hits = CounterMetricFamily("cache_hits", "캐시 hit 수", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "캐시 miss 수", labels=["cache"])
+        size = GaugeMetricFamily("cache_entries", "캐시 항목 수", labels=["cache"])
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            size.add_metric([name], stats["size"])
+        yield from (hits, misses, size)
+
+cache_collector = CacheCollector()
+REGISTRY.register(cache_collector)
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 히스토그램 기록과 Server-Timing 헤더(db 시간/쿼리 수, 전체 처리 시간) 추가
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                server_timing = f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", app;dur={total_ms:.2f}'
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"server-timing", server_timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats.reset(token)
+            route = scope.get("route")
+            # 매칭되지 않은 경로는 라벨 수가 늘어나지 않도록 하나로 묶음
+            route_path = route.path if route is not None else "unmatched"
+            REQUEST_LATENCY.labels(scope["method"], route_path, str(status_code)).observe(time.perf_counter() - start)
+            REQUEST_DB_QUERIES.labels(route_path).observe(stats.queries)
+            REQUEST_DB_TIME.labels(route_path).observe(stats.db_time)
+
+def render_metrics():
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,11 @@
+"""
+스키마 생성 스크립트 (앱 워커 기동 전에 한 번 실행)
+
+    python -m app.migrate
+"""
+from app.models import create_schema
+from app.logger import logger
+
+if __name__ == "__main__":
+    create_schema()
+    logger.info("스키마 생성 완료")
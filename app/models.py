@@ -1,40 +1,218 @@
 from sqlmodel import Field, SQLModel, create_engine, Relationship, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Index, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from typing import Optional, List
 from datetime import datetime
-from app.configs import DATABASE_URL
+import asyncio
+import random
+from app.configs import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DATABASE_REPLICA_URLS,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+)
+from app.metrics import instrument_engine, timed_pool
+import app.logger  # SQL_ECHO 설정에 따라 sqlalchemy.engine 로거 레벨 지정
 
 class User(SQLModel, table=True):
+    # 블로그 목록 Last-Modified에 작성자 프로필 변경 시각(max updatedAt)을 포함하기 위한 인덱스
+    __table_args__ = (Index("ix_user_updated", "updatedAt"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     createdAt: datetime = Field(default_factory=datetime.now)
     updatedAt: datetime = Field(default_factory=datetime.now)
     isDeleted: bool = Field(default=False)
-    email: str
-    nickname: str
+    email: str = Field(unique=True, index=True)
+    nickname: str = Field(unique=True, index=True)
     profileUrl: Optional[str] = None
     password: str
-    blogs: List["Blog"] = Relationship(back_populates="author")
+    # 비동기 세션에서는 암묵적 lazy load가 불가능하므로 접근 시 바로 에러 (목록은 작성자 컬럼을 join으로 조회)
+    blogs: List["Blog"] = Relationship(back_populates="author", sa_relationship_kwargs={"lazy": "raise"})
+
+# 부분 인덱스 조건 (isDeleted == False 조회가 리터럴로 컴파일되므로 그대로 매칭됨)
+LIVE_ROWS_ONLY = {"sqlite_where": text('"isDeleted" = 0'), "postgresql_where": text('"isDeleted" = false')}
 
 class Blog(SQLModel, table=True):
+    # (createdAt, id) 커서 페이지네이션용 복합 인덱스
+    # 부분 인덱스를 지원하는 DB는 삭제되지 않은 행만 색인하고, MySQL은 isDeleted를 포함한 복합 인덱스 사용
+    __table_args__ = (
+        Index("ix_blog_live_created_id", "createdAt", "id", **LIVE_ROWS_ONLY).ddl_if(dialect=("sqlite", "postgresql")),
+        Index("ix_blog_live_user_created_id", "userId", "createdAt", "id", **LIVE_ROWS_ONLY).ddl_if(dialect=("sqlite", "postgresql")),
+        Index("ix_blog_deleted_created_id", "isDeleted", "createdAt", "id").ddl_if(dialect="mysql"),
+        Index("ix_blog_user_deleted_created_id", "userId", "isDeleted", "createdAt", "id").ddl_if(dialect="mysql"),
+        # 목록 Last-Modified(max updatedAt) 계산용
+        Index("ix_blog_updated", "updatedAt"),
+        Index("ix_blog_user_updated", "userId", "updatedAt"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     createdAt: datetime = Field(default_factory=datetime.now)
     updatedAt: datetime = Field(default_factory=datetime.now)
     isDeleted: bool = Field(default=False)
     title: str
     content: str
+    viewCount: int = Field(default=0)  # 메모리에서 모은 조회수를 주기적으로 반영 (app/blog/views.py)
     userId: Optional[int] = Field(default=None, foreign_key="user.id")
-    author: Optional[User] = Relationship(back_populates="blogs")
+    author: Optional[User] = Relationship(back_populates="blogs", sa_relationship_kwargs={"lazy": "raise"})
+
+# 보존 기간이 지난 논리 삭제 행을 옮겨두는 아카이브 테이블 (app/archive.py)
+# 원본 id를 그대로 유지해 복원 시 같은 id로 되돌림
+class BlogArchive(SQLModel, table=True):
+    __tablename__ = "blog_archive"
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    createdAt: datetime
+    updatedAt: datetime
+    title: str
+    content: str
+    viewCount: int = 0
+    userId: Optional[int] = Field(default=None, index=True)
+    archivedAt: datetime = Field(default_factory=datetime.now)
+
+class UserArchive(SQLModel, table=True):
+    __tablename__ = "user_archive"
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    createdAt: datetime
+    updatedAt: datetime
+    email: str = Field(index=True)
+    nickname: str
+    profileUrl: Optional[str] = None
+    password: str
+    archivedAt: datetime = Field(default_factory=datetime.now)
+
+# 동기 드라이버 -> 비동기 드라이버 매핑 (운영: aiomysql, 로컬 테스트: aiosqlite)
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """
+    동기 DB URL을 비동기 드라이버 URL로 변환
+    """
+    url = make_url(url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+def pool_options(url: str, pool_class, name: str) -> dict:
+    """
+    configs의 풀 설정과 커넥션 대기 시간을 기록하는 풀 사용 (메모리 SQLite는 기본 풀 유지)
+    """
+    if make_url(url).database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": timed_pool(pool_class, name),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+def create_async_db_engine(url: str, name: str):
+    async_engine = create_async_engine(url, **pool_options(url, AsyncAdaptedQueuePool, name))
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+# 엔진은 처음 쓰일 때 생성 (import 시점에 드라이버 로딩/풀 생성 비용을 치르지 않도록)
+_engine = None
+_async_engine = None
+_replica_engines = None
+
+def get_engine():
+    """
+    동기 엔진 (스키마 생성 등 관리 작업용)
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL, QueuePool, "sync"))
+        instrument_engine(_engine)
+    return _engine
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(ASYNC_DATABASE_URL or to_async_url(DATABASE_URL), "primary")
+    return _async_engine
+
+def get_replica_engines() -> list:
+    global _replica_engines
+    if _replica_engines is None:
+        _replica_engines = [
+            create_async_db_engine(to_async_url(url), f"replica{index}")
+            for index, url in enumerate(DATABASE_REPLICA_URLS)
+        ]
+    return _replica_engines
+
+def create_schema():
+    """
+    없는 테이블/인덱스 생성 (python -m app.migrate 로 배포 시 한 번 실행)
+    """
+    SQLModel.metadata.create_all(get_engine())
+
+async def warm_up_engines(connections: int):
+    """
+    첫 요청이 커넥션 수립 비용을 치르지 않도록 엔진별로 커넥션을 미리 열어 풀에 반납
+    """
+    async def open_connection(async_engine):
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # 동시에 열어야 서로 다른 커넥션이 connections개 만들어짐
+    await asyncio.gather(*(
+        open_connection(async_engine)
+        for async_engine in [get_async_engine(), *get_replica_engines()]
+        for _ in range(connections)
+    ))
+
+def use_replica(statement):
+    """
+    복제본에서 읽어도 되는 조회로 표시 (같은 세션에서 쓰기가 있었다면 무시되고 primary 사용)
+    """
+    return statement.execution_options(use_replica=True)
+
+class RoutingSession(Session):
+    """
+    use_replica로 표시된 조회만 복제본으로, 나머지와 쓰기 이후의 모든 쿼리는 primary로 보내는 세션
+    """
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica_engines = get_replica_engines()
+        if (
+            replica_engines
+            and clause is not None
+            and not self._flushing
+            and not self.info.get("wrote")
+            and clause.get_execution_options().get("use_replica")
+        ):
+            return random.choice(replica_engines).sync_engine
+        return get_async_engine().sync_engine
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_wrote(session, flush_context):
+    # 이 요청에서 쓴 내용을 곧바로 읽을 수 있도록 이후 조회는 primary 고정
+    session.info["wrote"] = True
 
-engine = create_engine(DATABASE_URL, echo=True)
+# 커밋 후 속성 접근 시 암묵적 lazy load(IO)가 일어나지 않도록 expire_on_commit 비활성화
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False)
 
-SQLModel.metadata.create_all(engine)
+async def dispose_engines():
+    global _engine, _async_engine, _replica_engines
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    for replica_engine in _replica_engines or []:
+        await replica_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+    _engine = _async_engine = _replica_engines = None
 
 def get_session():
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
         
-def get_db():
-    db = Session(engine)
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
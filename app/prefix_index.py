@@ -0,0 +1,58 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List
+
+class PrefixIndex:
+    """
+    정렬된 배열 기반 접두사 검색 인덱스 (검색은 이진 탐색 O(log n) + k, 추가/삭제는 O(n) 메모리 이동)
+    키는 대소문자 무시 비교용으로 정규화한 값, 결과는 원래 값으로 반환
+    트라이보다 노드 객체가 없어 100만 건에서도 문자열 두 배열만큼의 메모리만 씀
+    """
+    def __init__(self):
+        self._keys: List[str] = []
+        self._values: List[str] = []
+
+    @staticmethod
+    def _key(value: str) -> str:
+        key = value.rstrip().casefold()
+        return value if key == value else key  # 이미 정규화된 값이면 문자열 객체를 공유
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, values: Iterable[str]):
+        """
+        전체 값으로 다시 구성 (정렬 한 번, 기동 시 사용)
+        """
+        pairs = sorted((self._key(value), value) for value in values)
+        self._keys = [key for key, _ in pairs]
+        self._values = [value for _, value in pairs]
+
+    def add(self, value: str):
+        key = self._key(value)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._values.insert(position, value)
+
+    def discard(self, value: str):
+        key = self._key(value)
+        position = bisect_left(self._keys, key)
+        # 정규화한 키가 같은 값이 여럿일 수 있으므로 원래 값까지 일치하는 항목만 제거
+        while position < len(self._keys) and self._keys[position] == key:
+            if self._values[position] == value:
+                del self._keys[position]
+                del self._values[position]
+                return
+            position += 1
+
+    def search(self, prefix: str, limit: int) -> List[str]:
+        """
+        접두사로 시작하는 값을 정렬 순서로 최대 limit개 반환
+        """
+        key = prefix.casefold()
+        start = bisect_left(self._keys, key)
+        results = []
+        for position in range(start, min(start + limit, len(self._keys))):
+            if not self._keys[position].startswith(key):
+                break
+            results.append(self._values[position])
+        return results
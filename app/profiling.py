@@ -0,0 +1,145 @@
+"""
+운영 중 느린 요청을 재배포 없이 들여다보기 위한 요청 단위 프로파일러
+
+X-Profile 헤더(PROFILER_TOKEN 값 또는 관리자 Bearer 토큰과 함께)를 보내거나 PROFILER_SAMPLE_RATE 비율로 무작위 선택된 요청을
+cProfile로 측정하고, 실행한 SQL 목록과 함께 PROFILER_DIR에 최대 PROFILER_MAX_FILES개까지 저장한다.
+응답의 X-Profile-Id로 관리자 API(/api/v1/profiles/{profile_id})에서 pstats 파일을 내려받아 snakeviz 등으로 연다.
+
+    python -m pstats data/profiles/<profile_id>.pstats
+"""
+import asyncio
+import cProfile
+import hmac
+import json
+import os
+import random
+import re
+import time
+import uuid
+from typing import List, Optional
+from app.configs import PROFILER_SAMPLE_RATE, PROFILER_TOKEN, PROFILER_DIR, PROFILER_MAX_FILES, PROFILER_MAX_STATEMENTS, ADMIN_EMAILS
+from app.metrics import request_stats
+from app.ratelimit import token_subject
+from app.logger import logger
+
+PROFILE_ID_PATTERN = re.compile(r"^\d{13}-[0-9a-f]{8}$")
+
+def profile_path(profile_id: str, suffix: str) -> Optional[str]:
+    """
+    저장된 프로파일 파일 경로 (형식이 맞지 않거나 없으면 None, 경로 조작 방지)
+    """
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = os.path.join(PROFILER_DIR, f"{profile_id}.{suffix}")
+    return path if os.path.exists(path) else None
+
+def list_profiles() -> List[dict]:
+    """
+    저장된 프로파일 요약 (최신순, SQL 목록 제외)
+    """
+    if not os.path.isdir(PROFILER_DIR):
+        return []
+    profiles = []
+    for name in sorted(os.listdir(PROFILER_DIR), reverse=True):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(PROFILER_DIR, name)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue  # 링에서 밀려나 방금 삭제된 파일
+        meta.pop("statements", None)
+        profiles.append(meta)
+    return profiles
+
+class ProfilingMiddleware:
+    """
+    선택된 요청을 cProfile로 측정해 pstats와 SQL 목록을 파일 링에 저장하고 X-Profile-Id 헤더로 알려줌
+    cProfile은 이벤트 루프 스레드 전체를 측정하므로 한 번에 한 요청만 프로파일링함
+    (같은 시간에 처리된 다른 요청의 코루틴도 결과에 섞일 수 있음)
+    """
+    def __init__(self, app, sample_rate: float = PROFILER_SAMPLE_RATE, directory: str = PROFILER_DIR, max_files: int = PROFILER_MAX_FILES):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_files = max_files
+        self.active = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.active:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        self.active = True
+        profile_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        stats = request_stats.get()  # MetricsMiddleware 안쪽에서 실행될 때만 SQL 기록
+        if stats is not None:
+            stats.statements = []
+        status_code = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.disable()
+            self.active = False
+            duration = time.perf_counter() - start
+            meta = {
+                "id": profile_id,
+                "trigger": trigger,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "queries": stats.queries if stats is not None else None,
+                "db_ms": round(stats.db_time * 1000, 2) if stats is not None else None,
+                "statements": [
+                    {"sql": statement, "ms": round(elapsed * 1000, 3)}
+                    for statement, elapsed in (stats.statements or [])[:PROFILER_MAX_STATEMENTS]
+                ] if stats is not None else [],
+            }
+            try:
+                # 파일 쓰기와 오래된 프로파일 정리는 이벤트 루프를 막지 않도록 스레드에서
+                await asyncio.to_thread(self._save, profiler, meta)
+            except Exception as e:
+                logger.error(f"프로파일 저장 실패: {e}")
+
+    def _trigger(self, scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                if PROFILER_TOKEN and hmac.compare_digest(value, PROFILER_TOKEN.encode()):
+                    return "token"
+                # get_current_user와 같이 엑세스 토큰만 인정 (수명이 긴 리프레시 토큰으로는 켤 수 없음)
+                if token_subject(scope, token_type="access") in ADMIN_EMAILS:
+                    return "admin"
+                return None
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def _save(self, profiler: cProfile.Profile, meta: dict):
+        os.makedirs(self.directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(self.directory, f"{meta['id']}.pstats"))
+        # 요약 파일을 마지막에 써서 목록에 보이는 프로파일은 항상 pstats가 있도록
+        with open(os.path.join(self.directory, f"{meta['id']}.json"), "w") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        profile_ids = sorted(name[:-len(".json")] for name in os.listdir(self.directory) if name.endswith(".json"))
+        for profile_id in profile_ids[:max(0, len(profile_ids) - self.max_files)]:
+            for suffix in ("json", "pstats"):
+                try:
+                    os.remove(os.path.join(self.directory, f"{profile_id}.{suffix}"))
+                except FileNotFoundError:
+                    pass
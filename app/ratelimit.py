@@ -0,0 +1,140 @@
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Pattern
+import jwt
+from app.configs import (
+    RATE_LIMITS, RATE_LIMIT_MAX_CLIENTS, RATE_LIMIT_TRUST_FORWARDED, MAX_CONCURRENT_REQUESTS,
+    JWT_SECRET_KEY, JWT_ALGORITHM,
+)
+from app.metrics import REQUESTS_REJECTED
+from app.responses import ORJSONResponse
+
+class TokenBucket:
+    """
+    클라이언트별 토큰 버킷 (capacity만큼 몰아서 보낼 수 있고 이후 초당 rate개씩 회복)
+    기억하는 클라이언트 수는 max_clients로 제한하고 가장 오래 안 쓰인 클라이언트부터 제거
+    """
+    def __init__(self, capacity: int, period: float, max_clients: int):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def acquire(self, key: str) -> float:
+        """
+        토큰을 하나 쓰고 0을 반환, 부족하면 다음 토큰까지 기다려야 하는 시간(초) 반환
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self.rate
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+class RouteLimit(NamedTuple):
+    method: str
+    route: str
+    pattern: Pattern
+    bucket: TokenBucket
+
+def parse_rate_limits(value: str, max_clients: int) -> List[RouteLimit]:
+    """
+    "POST /api/v1/users/login=10/60" 형식 목록을 라우트별 버킷으로 변환 (경로의 {param}은 한 세그먼트와 매칭)
+    """
+    limits = []
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        route, budget = item.rsplit("=", 1)
+        method, path = route.split()
+        count, period = budget.split("/")
+        pattern = re.compile("^" + re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(path)) + "$")
+        limits.append(RouteLimit(method.upper(), path, pattern, TokenBucket(int(count), float(period), max_clients)))
+    return limits
+
+def client_ip(scope) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+def token_subject(scope, token_type: Optional[str] = None) -> Optional[str]:
+    """
+    서명이 유효한 Bearer 토큰의 subject (위조한 subject로 새 버킷을 만들어 제한을 피하지 못하도록 검증)
+    token_type을 주면 그 종류(access/refresh)의 토큰만 인정
+    """
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+            except jwt.PyJWTError:
+                return None
+            if token_type is not None and payload.get("type") != token_type:
+                return None
+            return payload.get("sub")
+    return None
+
+class AdmissionMiddleware:
+    """
+    워커 전체 동시 처리 상한(초과 시 대기열에 쌓지 않고 503)과 비싼 라우트의 클라이언트별 처리율 제한(429)
+    """
+    def __init__(self, app, limits: Optional[List[RouteLimit]] = None, max_concurrent: int = MAX_CONCURRENT_REQUESTS):
+        self.app = app
+        self.limits = parse_rate_limits(RATE_LIMITS, RATE_LIMIT_MAX_CLIENTS) if limits is None else limits
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.max_concurrent and self.in_flight >= self.max_concurrent and scope["path"] != "/metrics":
+            REQUESTS_REJECTED.labels("*", "concurrency").inc()
+            await self._reject(scope, receive, send, 503, 1, "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.")
+            return
+
+        limit = self._match(scope)
+        if limit is not None:
+            keys = [f"ip:{client_ip(scope)}"]
+            subject = token_subject(scope)
+            if subject:
+                keys.append(f"sub:{subject}")
+            # IP와 subject 버킷을 모두 통과해야 함 (한 사용자가 여러 IP를, 한 IP가 여러 계정을 써도 제한)
+            retry_after = max(limit.bucket.acquire(key) for key in keys)
+            if retry_after > 0:
+                REQUESTS_REJECTED.labels(limit.route, "rate_limit").inc()
+                await self._reject(scope, receive, send, 429, retry_after, "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.")
+                return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    def _match(self, scope) -> Optional[RouteLimit]:
+        for limit in self.limits:
+            if limit.method == scope["method"] and limit.pattern.match(scope["path"]):
+                return limit
+        return None
+
+    async def _reject(self, scope, receive, send, status_code: int, retry_after: float, detail: str):
+        response = ORJSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
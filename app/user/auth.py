@@ -1,7 +1,12 @@
 from pydantic import BaseModel
 from datetime import timedelta
+from fastapi import Depends, HTTPException
 from fastapi_another_jwt_auth import AuthJWT
-from app.configs import JWT_ALGORITHM, JWT_SECRET_KEY, JWT_ACCESS_EXPIRE_MINUTES, JWT_REFRESH_EXPIRE_DAYS
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import get_db
+from app.user.crud import authenticate_access_token, get_current_user_by_email
+from app.user.schemas import CurrentUser
+from app.configs import ADMIN_EMAILS, JWT_ALGORITHM, JWT_SECRET_KEY, JWT_ACCESS_EXPIRE_MINUTES, JWT_REFRESH_EXPIRE_DAYS
 
 class Settings(BaseModel):
     authjwt_secret_key: str = JWT_SECRET_KEY
@@ -15,4 +20,27 @@ class Settings(BaseModel):
 
 @AuthJWT.load_config
 def get_config():
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+async def get_current_user(
+    Authorize: AuthJWT = Depends(),
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    """
+    엑세스 토큰의 유저를 캐시 우선으로 조회하는 의존성
+    """
+    email = authenticate_access_token(Authorize=Authorize)
+    current_user = await get_current_user_by_email(db, email)
+    if not current_user:
+        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
+    return current_user
+
+async def get_admin_user(
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
+    """
+    ADMIN_EMAILS에 등록된 유저만 허용하는 의존성
+    """
+    if current_user.email not in ADMIN_EMAILS:
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+    return current_user
@@ -1,51 +1,147 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from fastapi_another_jwt_auth import AuthJWT
 import jwt
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
-from app.user.schemas import UserBase, UpdateUserBase
-from app.models import User
-from app.configs import JWT_ACCESS_EXPIRE_MINUTES, JWT_SECRET_KEY
+from app.user.schemas import UserBase, UpdateUserBase, CurrentUser
+from sqlmodel import select
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from app.models import User, UserArchive, use_replica
+from app.cache import TTLCache
+from app.bloom import BloomFilter
+from app.prefix_index import PrefixIndex
+from app.blog.cache import invalidate_blog_lists, invalidate_author_blogs
+from app.configs import (
+    JWT_ACCESS_EXPIRE_MINUTES, JWT_SECRET_KEY, CURRENT_USER_CACHE_SIZE, CURRENT_USER_CACHE_TTL, USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE,
+    NICKNAME_SUGGEST_MAX_LIMIT, USER_INDEX_REFRESH_SECONDS, USER_INDEX_SYNC_OVERLAP_SECONDS, USER_INDEX_REBUILD_SECONDS,
+)
 from app.logger import logger
+import asyncio
 import time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.user.hashing import verify_password_async, get_password_hash_async
 
-def verify_password(plain_password, hashed_password):
+# JWT subject(이메일) -> CurrentUser 캐시
+current_user_cache = TTLCache(maxsize=CURRENT_USER_CACHE_SIZE, ttl=CURRENT_USER_CACHE_TTL)
+
+# 중복체크용 이메일/닉네임 블룸 필터 (load_user_filters 완료 전에는 항상 DB 조회)
+email_filter = BloomFilter(USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE)
+nickname_filter = BloomFilter(USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE)
+user_filters_ready = False
+
+# 닉네임 자동완성용 접두사 인덱스 (탈퇴하지 않은 유저만, load_user_filters 완료 전에는 DB 조회)
+nickname_index = PrefixIndex()
+# 필터/인덱스에 반영한 유저의 최신 updatedAt (sync_user_index가 이후 변경분만 읽음)
+user_index_watermark = None
+
+def _filter_key(value: str) -> str:
+    # MySQL의 대소문자 무시(_ci)·후행 공백 무시 비교와 어긋나지 않도록 정규화
+    return value.rstrip().casefold()
+
+async def load_user_filters(db):
+    """
+    User 테이블 전체로 블룸 필터와 닉네임 인덱스 구성 (기동 시, 이후 USER_INDEX_REBUILD_SECONDS마다)
+    구성하는 동안에도 기존 필터/인덱스로 응답하도록 새 객체를 만든 뒤 한 번에 교체
+    (그사이 이 워커에서 반영한 쓰기는 다음 sync_user_index의 겹침 구간에서 다시 반영됨)
+    """
+    global email_filter, nickname_filter, nickname_index, user_filters_ready, user_index_watermark
+    emails = BloomFilter(USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE)
+    nicknames = BloomFilter(USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE)
+    live_nicknames, newest = [], None
+    statement = select(User.email, User.nickname, User.isDeleted, User.updatedAt)
+    result = await db.stream(statement.execution_options(yield_per=10000))
+    async for email, nickname, is_deleted, updated_at in result:
+        emails.add(_filter_key(email))
+        nicknames.add(_filter_key(nickname))
+        if not is_deleted:
+            live_nicknames.append(nickname)
+        if newest is None or updated_at > newest:
+            newest = updated_at
+    index = PrefixIndex()
+    await asyncio.to_thread(index.build, live_nicknames)  # 100만 건 정렬 중에도 다른 요청을 처리하도록
+    email_filter, nickname_filter, nickname_index = emails, nicknames, index
+    user_index_watermark = newest
+    user_filters_ready = True
+    logger.info(f"유저 블룸 필터 구성 완료: {email_filter.count}건, 닉네임 인덱스 {len(nickname_index)}건")
+
+async def sync_user_index(db):
     """
-    비밀번호 해시값 비교
+    watermark 이후 변경된 유저(가입/탈퇴/복원/닉네임 변경)를 블룸 필터와 닉네임 인덱스에 반영
+    sync_search_index와 같이 USER_INDEX_SYNC_OVERLAP_SECONDS만큼 겹쳐 읽고, 같은 행을 다시 반영해도 결과가 같도록 지운 뒤 추가
+    다른 워커에서 바뀐 닉네임의 옛 값은 알 수 없으므로 다음 전체 재구성까지 자동완성에 남음
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    global user_index_watermark
+    if not user_filters_ready:
+        return
+    statement = select(User.email, User.nickname, User.isDeleted, User.updatedAt)
+    if user_index_watermark is not None:
+        statement = statement.where(User.updatedAt >= user_index_watermark - timedelta(seconds=USER_INDEX_SYNC_OVERLAP_SECONDS))
+    newest = user_index_watermark
+    result = await db.stream(statement.execution_options(yield_per=1000))
+    async for email, nickname, is_deleted, updated_at in result:
+        email_filter.add(_filter_key(email))
+        nickname_filter.add(_filter_key(nickname))
+        nickname_index.discard(nickname)
+        if not is_deleted:
+            nickname_index.add(nickname)
+        if newest is None or updated_at > newest:
+            newest = updated_at
+    user_index_watermark = newest
 
-def get_password_hash(password):
+async def refresh_user_index_periodically(session_factory):
     """
-    비밀번호 해시값 생성
+    USER_INDEX_REFRESH_SECONDS마다 변경분 반영, USER_INDEX_REBUILD_SECONDS마다 전체 재구성
+    (다른 워커의 가입/탈퇴는 갱신 주기, 닉네임 변경의 옛 값은 재구성 주기만큼 늦게 반영)
     """
-    return pwd_context.hash(password)
+    last_rebuild = time.monotonic()
+    while True:
+        await asyncio.sleep(USER_INDEX_REFRESH_SECONDS)
+        try:
+            async with session_factory() as db:
+                if USER_INDEX_REBUILD_SECONDS and time.monotonic() - last_rebuild >= USER_INDEX_REBUILD_SECONDS:
+                    await load_user_filters(db)
+                    last_rebuild = time.monotonic()
+                else:
+                    await sync_user_index(db)
+        except Exception as e:
+            logger.error(f"유저 인덱스 갱신 실패: {e}")
 
 
-def get_user(db, email: str):
+async def get_user(db, email: str):
     """
     사용자 정보 데이터베이스에서 조회
     """
-    user_dict = db.query(User).filter(User.email == email).first()
+    user_dict = (await db.exec(select(User).where(User.email == email))).first()
     if user_dict:
         return user_dict
     else:
         False
 
-def authenticate_user(db, email: str, password: str):
+async def get_current_user_by_email(db, email: str):
+    """
+    캐시에 없을 때만 DB에서 사용자를 조회해 CurrentUser로 반환
+    """
+    current_user = current_user_cache.get(email)
+    if current_user is None:
+        user = await get_user(db, email)
+        if not user:
+            return None
+        current_user = CurrentUser(id=user.id, email=user.email, nickname=user.nickname, profileUrl=user.profileUrl)
+        current_user_cache.set(email, current_user)
+    return current_user
+
+async def authenticate_user(db, email: str, password: str):
     """
     사용자 인증
     """
-    user = get_user(db, email)
+    user = await get_user(db, email)
     if not user:
         raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="비밀번호나 아이디가 틀렸습니다.",
         headers={"WWW-Authenticate": "Bearer"},
         )
-    if not verify_password(password, user.password):
+    if not await verify_password_async(password, user.password):
         return False
     return user
 
@@ -55,7 +151,7 @@ def authenticate_access_token(Authorize: AuthJWT) -> str:
     """
     Authorize.jwt_required()
     email = Authorize.get_jwt_subject()
-    logger.info(f"유저 이메일: {email} 엑세스 토큰 확인 완료")
+    logger.debug("유저 이메일: %s 엑세스 토큰 확인 완료", email)
     return email
 
 def decode_jwt(token: str):
@@ -72,7 +168,7 @@ def authenticate_refresh_token(Authorize: AuthJWT) -> str:
     """
     Authorize.jwt_refresh_token_required()
     email = Authorize.get_jwt_subject()
-    logger.info(f"유저 이메일: {email} 리프레시 토큰 확인 완료")
+    logger.debug("유저 이메일: %s 리프레시 토큰 확인 완료", email)
     return create_access_token(email, Authorize)
 
 def create_tokens_in_body(email: str, Authorize: AuthJWT) -> dict:
@@ -97,66 +193,178 @@ def create_refresh_token(email: str, Authorize: AuthJWT):
     return Authorize.create_refresh_token(subject=email)
 
 
-def create_user(db, user: UserBase):
+async def create_user(db, user: UserBase):
     """
     사용자 생성
     """
-    check_user = get_user(db, user.email)
+    check_user = await get_user(db, user.email)
     if check_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 가입된 아이디입니다.",
         )
-    hashed_password = get_password_hash(user.password)
+    if await check_nickname_duplicate(db, user.nickname):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다.",
+        )
+    hashed_password = await get_password_hash_async(user.password)
     user.password = hashed_password
     try:
         db_user = User(**user.model_dump())
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
-    except Exception as e:
-        db.rollback()
-        return e
+        await db.commit()
+        await db.refresh(db_user)
+    except IntegrityError as e:
+        # 중복 확인과 커밋 사이에 다른 요청이 같은 이메일/닉네임으로 가입한 경우
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다." if "nickname" in str(e.orig) else "이미 가입된 아이디입니다.",
+        )
+    except Exception:
+        await db.rollback()
+        logger.exception(f"회원가입 실패: {user.email}")
+        return False
+    email_filter.add(_filter_key(db_user.email))
+    nickname_filter.add(_filter_key(db_user.nickname))
+    nickname_index.add(db_user.nickname)
     return True
 
-def update_user_profile(db, email, profile_data: UpdateUserBase, profile_url: str = None) -> bool:
-    user = get_user(db, email)
+async def update_user_profile(db, email, profile_data: UpdateUserBase, profile_url: str = None) -> bool:
+    user = await get_user(db, email)
     if not user:
         return False
+    if profile_data.nickname != user.nickname and await check_nickname_duplicate(db, profile_data.nickname):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다.",
+        )
     try:
+        old_nickname = user.nickname
         user.nickname = profile_data.nickname
         
         if profile_url:
             user.profileUrl = profile_url
+        user.updatedAt = datetime.now()  # 블로그 목록 Last-Modified에 반영
         
-        db.commit()
-        return True     
-    except Exception as e:
-        db.rollback()
-        print(e)
+        await db.commit()
+        current_user_cache.invalidate(email)
+        nickname_filter.add(_filter_key(user.nickname))
+        if old_nickname != user.nickname and not user.isDeleted:
+            nickname_index.discard(old_nickname)
+            nickname_index.add(user.nickname)
+        invalidate_blog_lists(user.id)  # 목록에 작성자 닉네임이 포함되므로
+        invalidate_author_blogs(user.id)
+        return True
+    except IntegrityError:
+        # 중복 확인과 커밋 사이에 다른 요청이 같은 닉네임을 가져간 경우
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다.",
+        )
+    except Exception:
+        await db.rollback()
+        logger.exception(f"프로필 수정 실패: {email}")
         return False
     
-def check_email_duplicate(db, email: str) -> bool:
-    return db.query(User).filter(User.email == email).first() is not None
+async def set_profile_url(db, email: str, profile_url: str) -> bool:
+    """
+    프로필 이미지 URL만 변경
+    닉네임은 건드리지 않으므로 다른 워커에서 바뀐 닉네임을 캐시된 CurrentUser 값으로 되돌리지 않음
+    """
+    user = await get_user(db, email)
+    if not user:
+        return False
+    try:
+        user.profileUrl = profile_url
+        user.updatedAt = datetime.now()  # 블로그 목록 Last-Modified에 반영
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        logger.exception(f"프로필 이미지 수정 실패: {email}")
+        return False
+    current_user_cache.invalidate(email)
+    invalidate_blog_lists(user.id)  # 목록에 작성자 프로필 이미지가 포함되므로
+    invalidate_author_blogs(user.id)
+    return True
 
-def check_nickname_duplicate(db, nickname: str) -> bool:
-    return db.query(User).filter(User.nickname == nickname).first() is not None
+async def check_email_duplicate(db, email: str, replica: bool = False) -> bool:
+    """
+    replica는 조회 전용 사용 가능 여부 확인에서만 사용
+    쓰기 전 검사(replica=False)는 블룸 필터도 건너뛰고 primary를 직접 조회
+    (필터는 이 워커의 쓰기만 반영하므로 다른 워커에서 가입한 값은 필터에 없을 수 있음)
+    """
+    # 필터에 없으면 (이 워커가 아는 한) 사용 가능, 있을 수도 있을 때만 인덱스 조회
+    if replica and user_filters_ready and _filter_key(email) not in email_filter:
+        return False
+    statement = select(User.id).where(User.email == email)
+    return (await db.exec(use_replica(statement) if replica else statement)).first() is not None
 
+async def check_nickname_duplicate(db, nickname: str, replica: bool = False) -> bool:
+    """
+    check_email_duplicate와 같이 replica=True(사용 가능 여부 조회)일 때만 블룸 필터 사용
+    """
+    if replica and user_filters_ready and _filter_key(nickname) not in nickname_filter:
+        return False
+    statement = select(User.id).where(User.nickname == nickname)
+    return (await db.exec(use_replica(statement) if replica else statement)).first() is not None
+
+async def suggest_nicknames(db, prefix: str, limit: int) -> list:
+    """
+    접두사로 시작하는 탈퇴하지 않은 유저의 닉네임 (정렬 순서로 최대 limit개)
+    """
+    limit = min(limit, NICKNAME_SUGGEST_MAX_LIMIT)
+    if user_filters_ready:
+        return nickname_index.search(prefix, limit)
+    statement = (
+        select(User.nickname)
+        .where(User.nickname.startswith(prefix, autoescape=True), User.isDeleted == False)
+        .order_by(User.nickname)
+        .limit(limit)
+    )
+    return list((await db.exec(use_replica(statement))).all())
 
-def delete_user_from_db(db, email: str):
+async def delete_user_from_db(db, email: str):
     """
     사용자를 논리적으로 삭제 (isDeleted 필드를 True로 설정)
     """
-    user = get_user(db, email)
+    user = await get_user(db, email)
     if not user:
         raise HTTPException(status_code=400, detail="User not found.")
 
     try:
         user.isDeleted = True
-        db.commit()
+        user.updatedAt = datetime.now()  # 아카이브 보존 기간의 기준 시각
+        await db.commit()
+        current_user_cache.invalidate(email)
+        nickname_index.discard(user.nickname)
         logger.info(f"User with email {email} has been deleted.")
         return True
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error while deleting user {email}: {e}")
-        raise HTTPException(status_code=500, detail="유저 삭제 실패")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="유저 삭제 실패")
+
+async def restore_user(db, user_id: int) -> User:
+    """
+    아카이브 테이블의 유저를 같은 id로 되살림 (그사이 같은 이메일/닉네임으로 가입한 유저가 있으면 409)
+    """
+    archived = await db.get(UserArchive, user_id)
+    if not archived:
+        raise HTTPException(status_code=404, detail="아카이브된 유저가 없습니다.")
+    statement = select(User.id).where(or_(User.email == archived.email, User.nickname == archived.nickname))
+    if (await db.exec(statement)).first() is not None:
+        raise HTTPException(status_code=409, detail="같은 이메일 또는 닉네임의 유저가 이미 있습니다.")
+
+    user = User(**archived.model_dump(exclude={"archivedAt"}), isDeleted=False)
+    user.updatedAt = datetime.now()
+    db.add(user)
+    await db.delete(archived)
+    await db.commit()
+    email_filter.add(_filter_key(user.email))
+    nickname_filter.add(_filter_key(user.nickname))
+    nickname_index.add(user.nickname)
+    logger.info(f"User {user_id} has been restored from archive.")
+    return user
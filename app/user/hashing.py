@@ -0,0 +1,110 @@
+import asyncio
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from passlib.hash import bcrypt
+from app.configs import PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_SIZE, BCRYPT_ROUNDS, BCRYPT_TARGET_MS
+from app.logger import logger
+
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+CALIBRATION_PROBE_ROUNDS = 8
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+_executor = None
+_pending = 0
+bcrypt_rounds = BCRYPT_ROUNDS
+
+def verify_password(plain_password, hashed_password):
+    """
+    비밀번호 해시값 비교
+    """
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password, rounds: int = None):
+    """
+    비밀번호 해시값 생성
+    """
+    return bcrypt.using(rounds=rounds or bcrypt_rounds).hash(password)
+
+def calibrate_rounds(target_ms: int) -> int:
+    """
+    해시 1회가 target_ms에 가까워지는 bcrypt cost 계산 (cost가 1 오를 때마다 시간은 2배)
+    """
+    start = time.perf_counter()
+    get_password_hash("calibration", rounds=CALIBRATION_PROBE_ROUNDS)
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
+    rounds = CALIBRATION_PROBE_ROUNDS + int(math.log2(max(target_ms / elapsed_ms, 1)))
+    return min(max(rounds, BCRYPT_MIN_ROUNDS), BCRYPT_MAX_ROUNDS)
+
+def _create_executor() -> ProcessPoolExecutor:
+    # 이벤트 루프 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+    return ProcessPoolExecutor(
+        max_workers=PASSWORD_HASH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+def _replace_broken_pool(broken: ProcessPoolExecutor):
+    """
+    워커가 죽어 깨진 풀을 새 풀로 교체 (동시에 실패한 요청들이 여러 번 교체하지 않도록 같은 풀일 때만)
+    """
+    global _executor
+    if _executor is broken:
+        logger.error("비밀번호 해시 워커가 비정상 종료되어 프로세스 풀을 다시 만듭니다.")
+        broken.shutdown(wait=False, cancel_futures=True)
+        _executor = _create_executor()
+
+async def _run_in_pool(func, *args):
+    """
+    bcrypt 작업을 프로세스 풀에서 실행, 대기열이 가득 차면 503으로 즉시 거절
+    """
+    global _pending
+    if _executor is None:
+        return func(*args)
+    if _pending >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE:
+        logger.warning(f"비밀번호 해시 대기열 초과: {_pending}건 처리 중")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+    _pending += 1
+    executor = _executor
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        _replace_broken_pool(executor)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="일시적으로 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+    finally:
+        _pending -= 1
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await _run_in_pool(get_password_hash, password, bcrypt_rounds)
+
+async def start_password_pool():
+    """
+    bcrypt 프로세스 풀 생성 및 cost 보정
+    """
+    global _executor, bcrypt_rounds
+    _executor = _create_executor()
+    if BCRYPT_TARGET_MS > 0:
+        bcrypt_rounds = await asyncio.get_running_loop().run_in_executor(_executor, calibrate_rounds, BCRYPT_TARGET_MS)
+    logger.info(f"bcrypt cost {bcrypt_rounds}, 해시 워커 {PASSWORD_HASH_WORKERS}개")
+
+def shutdown_password_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .crud import get_user, create_user, create_tokens_in_body, authenticate_refresh_token, authenticate_user, authenticate_access_token, update_user_profile, check_email_duplicate, check_nickname_duplicate, delete_user_from_db
-from .schemas import Token, UserBase, UpdateUserBase, LoginData
-from .auth import AuthJWT
+from .crud import get_user, create_user, create_tokens_in_body, authenticate_refresh_token, authenticate_user, authenticate_access_token, update_user_profile, set_profile_url, check_email_duplicate, check_nickname_duplicate, delete_user_from_db, restore_user, suggest_nicknames
+from .schemas import Token, UserBase, UpdateUserBase, LoginData, CurrentUser, UserProfile, ProfileUploadRequest, ProfileUploadConfirm, NicknameSuggestions
+from .auth import AuthJWT, get_current_user, get_admin_user
 from app.logger import logger
 from app.models import get_db
-from app.bucket.s3_client import client_s3 
-from app.bucket.crud import upload_file_to_s3
+from app.bucket.crud import upload_file_to_s3, create_presigned_upload, head_uploaded_object, get_object_url_async
+from app.configs import PROFILE_IMAGE_MAX_BYTES, PROFILE_IMAGE_CONTENT_TYPES, NICKNAME_SUGGEST_DEFAULT_LIMIT, NICKNAME_SUGGEST_MAX_LIMIT
+import os
+import uuid
 
 router = APIRouter(
     prefix="/api/v1/users",
@@ -27,17 +29,17 @@ async def get_token(Authorize: AuthJWT = Depends()):
 async def signup(
     signup_data: UserBase,  # JSON 데이터로 받음
     Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
         회원가입
     """
     userForm = UserBase(email=signup_data.email, password=signup_data.password, nickname=signup_data.nickname)
-    result = create_user(db, userForm)
+    result = await create_user(db, userForm)
     
-    logger.info(result)
+    logger.debug("회원가입 결과: %s", result)
     if result != True:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="회원가입 실패")
     
     response_body = create_tokens_in_body(signup_data.email, Authorize)
     response_body["message"] = "유저 생성 및 로그인 성공"
@@ -47,28 +49,28 @@ async def signup(
 async def login(
     login_data: LoginData,  # JSON 데이터로 받음
     Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Token:
     """
         로그인
     """
-    user = authenticate_user(db, login_data.email, login_data.password)
+    user = await authenticate_user(db, login_data.email, login_data.password)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비밀번호나 아이디가 틀렸습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     response_body = create_tokens_in_body(login_data.email, Authorize)
-    logger.info(f"엑세스 토큰 기간 {Authorize._access_token_expires}")
-    logger.info(f"디버깅용 유저 정보 {user.email}")
+    logger.debug("엑세스 토큰 기간 %s", Authorize._access_token_expires)
+    logger.debug("디버깅용 유저 정보 %s", user.email)
     return JSONResponse(status_code=200, content=response_body)
 
 @router.get("/profile", summary="내 정보 조회", status_code=200)
 async def get_profile(
-    Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    user: CurrentUser = Depends(get_current_user),
 ):
-    email = authenticate_access_token(Authorize=Authorize)
-    user = get_user(db, email)
-    if not user:
-        raise HTTPException(status_code=400, detail="User not found.")
-    
-    user_profile = UpdateUserBase(
+    user_profile = UserProfile(
         nickname=user.nickname,
         profileUrl=user.profileUrl or ""
     )
@@ -79,39 +81,90 @@ async def update_profile(
     profile_data: UpdateUserBase,  
     file: UploadFile = None, 
     Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     email = authenticate_access_token(Authorize=Authorize)
     
     # 프로필 사진이 있는 경우 S3에 업로드하고 URL 받기
     profile_url = None
     if file:
-        profile_url = await upload_file_to_s3(file, client_s3)
+        profile_url = await upload_file_to_s3(file)
     
     # 프로필 업데이트 로직에 URL 전달
-    result = update_user_profile(db, email, profile_data, profile_url)
+    result = await update_user_profile(db, email, profile_data, profile_url)
     
     if not result:
         raise HTTPException(status_code=500, detail="프로필 수정 실패")
 
     return JSONResponse(content={"message": "프로필 수정 완료", "email": email}, status_code=201)
 
+@router.post("/profile/upload-url", summary="프로필 이미지 업로드 URL 발급", status_code=200)
+async def create_profile_upload_url(
+    upload_data: ProfileUploadRequest,
+    user: CurrentUser = Depends(get_current_user),
+):
+    """
+    S3에 직접 업로드할 presigned POST/PUT URL 발급 (API 서버는 파일 본문을 받지 않음)
+    """
+    if upload_data.content_type not in PROFILE_IMAGE_CONTENT_TYPES:
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
+    extension = os.path.splitext(upload_data.filename)[1].lower()
+    key = f"profile/{user.id}/{uuid.uuid4().hex}{extension}"
+    upload = await create_presigned_upload(key, upload_data.content_type, PROFILE_IMAGE_MAX_BYTES)
+    upload["max_bytes"] = PROFILE_IMAGE_MAX_BYTES
+    return JSONResponse(content=upload, status_code=200)
+
+@router.post("/profile/upload-confirm", summary="프로필 이미지 업로드 확인", status_code=200)
+async def confirm_profile_upload(
+    confirm_data: ProfileUploadConfirm,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    업로드된 객체를 확인한 뒤 프로필 URL로 저장
+    """
+    if not confirm_data.key.startswith(f"profile/{user.id}/"):
+        raise HTTPException(status_code=403, detail="본인의 업로드만 확인할 수 있습니다.")
+    head = await head_uploaded_object(confirm_data.key)
+    if head is None:
+        raise HTTPException(status_code=404, detail="업로드된 파일이 없습니다.")
+    if head["ContentLength"] > PROFILE_IMAGE_MAX_BYTES or head.get("ContentType") not in PROFILE_IMAGE_CONTENT_TYPES:
+        raise HTTPException(status_code=400, detail="파일 크기 또는 형식이 올바르지 않습니다.")
+
+    profile_url = await get_object_url_async(confirm_data.key)
+    result = await set_profile_url(db, user.email, profile_url)
+    if not result:
+        raise HTTPException(status_code=500, detail="프로필 수정 실패")
+
+    return JSONResponse(content={"message": "프로필 수정 완료", "profileUrl": profile_url}, status_code=200)
+
 @router.get("/email", summary="이메일 중복체크", status_code=200)
-async def check_email(email: str, db: Session = Depends(get_db)):
+async def check_email(email: str, db: AsyncSession = Depends(get_db)):
     """
     이메일 중복체크
     """
-    is_duplicate = check_email_duplicate(db, email)
+    is_duplicate = await check_email_duplicate(db, email, replica=True)
     if is_duplicate:
         return JSONResponse(content={"message": "이미 사용 중인 이메일입니다."}, status_code=400)
     return JSONResponse(content={"message": "사용 가능한 이메일입니다."}, status_code=200)
 
+@router.get("/nickname/suggest", summary="닉네임 자동완성", status_code=200, response_model=NicknameSuggestions)
+async def suggest_nickname(
+    prefix: str = Query(min_length=1),
+    limit: int = Query(NICKNAME_SUGGEST_DEFAULT_LIMIT, ge=1, le=NICKNAME_SUGGEST_MAX_LIMIT),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    접두사로 시작하는 닉네임 목록 (멘션/작성자 검색용)
+    """
+    return NicknameSuggestions(nicknames=await suggest_nicknames(db, prefix, limit))
+
 @router.get("/nickname", summary="닉네임 중복체크", status_code=200)
-async def check_nickname(nickname: str, db: Session = Depends(get_db)):
+async def check_nickname(nickname: str, db: AsyncSession = Depends(get_db)):
     """
     닉네임 중복체크
     """
-    is_duplicate = check_nickname_duplicate(db, nickname)
+    is_duplicate = await check_nickname_duplicate(db, nickname, replica=True)
     if is_duplicate:
         return JSONResponse(content={"message": "이미 사용 중인 닉네임입니다."}, status_code=400)
     return JSONResponse(content={"message": "사용 가능한 닉네임입니다."}, status_code=200)
@@ -119,15 +172,27 @@ async def check_nickname(nickname: str, db: Session = Depends(get_db)):
 @router.delete("/delete", summary="회원 탈퇴", status_code=200)
 async def delete_user(
     Authorize: AuthJWT = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     사용자 삭제 (논리 삭제)
     """
     email = authenticate_access_token(Authorize=Authorize)
-    result = delete_user_from_db(db, email)
+    result = await delete_user_from_db(db, email)
     
     if result:
         return JSONResponse(content={"message": "유저 삭제 완료", "email": email}, status_code=200)
     else:
-        raise HTTPException(status_code=500, detail="유저 삭제 실패")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="유저 삭제 실패")
+
+@router.post("/archive/{user_id}/restore", summary="아카이브된 유저 복원", status_code=200)
+async def restore_archived_user(
+    user_id: int,
+    admin: CurrentUser = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    아카이브된 유저 복원 (관리자)
+    """
+    user = await restore_user(db, user_id)
+    return JSONResponse(content={"message": "유저가 복원되었습니다", "nickname": user.nickname}, status_code=200)
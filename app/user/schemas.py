@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import timedelta
+from typing import List, Optional
 from app.configs import JWT_ALGORITHM, JWT_SECRET_KEY, JWT_ACCESS_EXPIRE_MINUTES, JWT_REFRESH_EXPIRE_DAYS
 
 class Token(BaseModel):
@@ -24,6 +25,26 @@ class UserBase(BaseModel):
 class UpdateUserBase(BaseModel):
     nickname: str
 
+class UserProfile(BaseModel):
+    nickname: str
+    profileUrl: str
+
 class LoginData(BaseModel):
     email: str
-    password: str
\ No newline at end of file
+    password: str
+class CurrentUser(BaseModel):
+    id: int
+    email: str
+    nickname: str
+    profileUrl: Optional[str] = None
+
+
+class ProfileUploadRequest(BaseModel):
+    filename: str
+    content_type: str
+
+class ProfileUploadConfirm(BaseModel):
+    key: str
+
+class NicknameSuggestions(BaseModel):
+    nicknames: List[str]
@@ -0,0 +1,107 @@
+"""
+응답 압축 인코딩/레벨별 전송 바이트와 요청당 CPU 시간 비교
+
+실제 앱에 합성 데이터를 적재하고 목록/단건 응답 본문을 받아온 뒤, 각 인코딩·레벨로 압축해 측정한다.
+"cached"는 (ETag, 인코딩) 캐시에 적중해 직렬화·압축 없이 응답하는 경우.
+
+    python -m bench.compression --posts 2000 --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+
+from bench.run import configure_environment
+from bench.seed import seed
+
+LEVELS = {
+    "gzip": [1, 6, 9],
+    "br": [1, 5, 11],
+    "zstd": [1, 3, 10, 19],
+}
+
+async def fetch_payloads(users: int, posts: int) -> dict:
+    from httpx import ASGITransport, AsyncClient
+    from app import models
+    from app.main import app
+
+    models.create_schema()
+    seed(models.get_engine(), users, posts, "bench")
+    payloads = {}
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            for name, url, params in (
+                ("list_20", "/api/v1/blogs", {"limit": 20}),
+                ("list_100", "/api/v1/blogs", {"limit": 100}),
+                ("detail", "/api/v1/blogs/1", {}),
+            ):
+                response = await client.get(url, params=params, headers={"Accept-Encoding": "identity"})
+                payloads[name] = response.content
+    return payloads
+
+def cpu_per_call(func, body: bytes, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        func(body)
+    return (time.process_time() - start) / iterations * 1e6
+
+def measure(payloads: dict, iterations: int) -> dict:
+    from app.cache import TTLCache
+    from app.compression import compressors
+
+    results = {}
+    for name, body in payloads.items():
+        rows = [{"encoding": "identity", "level": None, "bytes": len(body), "ratio": 1.0, "cpu_us": 0.0}]
+        for encoding, levels in LEVELS.items():
+            for level in levels:
+                available = compressors(level, level, level)
+                if encoding not in available:
+                    continue
+                compress = available[encoding]
+                compressed = compress(body)
+                rows.append({
+                    "encoding": encoding,
+                    "level": level,
+                    "bytes": len(compressed),
+                    "ratio": round(len(body) / len(compressed), 2),
+                    "cpu_us": round(cpu_per_call(compress, body, iterations), 1),
+                })
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("etag", "gzip"), b"")
+        rows.append({
+            "encoding": "cached",
+            "level": None,
+            "bytes": None,
+            "ratio": None,
+            "cpu_us": round(cpu_per_call(lambda _: cache.get(("etag", "gzip")), body, iterations * 100), 3),
+        })
+        results[name] = rows
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        configure_environment(workdir)
+        payloads = asyncio.run(fetch_payloads(args.users, args.posts))
+    results = measure(payloads, args.iterations)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, rows in results.items():
+        print(f"[{name}] {len(payloads[name])} bytes", file=sys.stdout)
+        for row in rows:
+            level = "" if row["level"] is None else row["level"]
+            size = "" if row["bytes"] is None else f"{row['bytes']:>8} B  x{row['ratio']:<6}"
+            print(f"  {row['encoding']:>8} {level!s:>3}  {size:<24} {row['cpu_us']:>10} us/req")
+
+if __name__ == "__main__":
+    main()
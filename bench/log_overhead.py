@@ -0,0 +1,57 @@
+"""
+요청 경로에서의 로깅 비용 비교 (동기 StreamHandler vs 큐 파이프라인)
+
+    python -m bench.log_overhead --records 100000
+"""
+import argparse
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueListener
+
+def measure(logger: logging.Logger, records: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        logger.info("유저 이메일: %s 엑세스 토큰 확인 완료", f"user{i}@example.com")
+    return (time.perf_counter() - start) / records * 1e6
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로깅 오버헤드 마이크로 벤치마크")
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    from app.logger import DroppingQueueHandler, JSONFormatter, SamplingFilter
+
+    with open(os.devnull, "w") as devnull:
+        results = {}
+
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.propagate = False
+        sync_handler = logging.StreamHandler(devnull)
+        sync_handler.setFormatter(JSONFormatter())
+        sync_logger.addHandler(sync_handler)
+        results["sync_stream"] = measure(sync_logger, args.records)
+
+        for name, rates in (("queue", {}), ("queue_sampled_10pct", {logging.INFO: 0.1})):
+            queue_logger = logging.getLogger(f"bench.{name}")
+            queue_logger.propagate = False
+            stream_handler = logging.StreamHandler(devnull)
+            stream_handler.setFormatter(JSONFormatter())
+            queue_handler = DroppingQueueHandler(queue.Queue(maxsize=args.records))
+            queue_handler.addFilter(SamplingFilter(rates))
+            listener = QueueListener(queue_handler.queue, stream_handler)
+            listener.start()
+            queue_logger.addHandler(queue_handler)
+            results[name] = measure(queue_logger, args.records)
+            listener.stop()
+
+        disabled_logger = logging.getLogger("bench.disabled")
+        disabled_logger.setLevel(logging.WARNING)
+        results["below_level"] = measure(disabled_logger, args.records)
+
+    for name, micros in results.items():
+        print(f"{name:>22}: {micros:.2f} us/record")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+닉네임 자동완성: 메모리 접두사 인덱스 vs DB LIKE 'prefix%' 지연 시간 비교
+
+합성 유저를 적재한 뒤 인덱스 구성 시간/메모리, 검색·추가·삭제 한 건당 시간과
+같은 접두사로 User 테이블을 조회하는 시간을 측정한다 (--sql-queries 0이면 DB 비교 생략).
+
+    python -m bench.nickname_suggest --users 1000000
+"""
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+
+from bench.run import configure_environment, percentile
+from bench.seed import seed
+
+def prefixes(rng: random.Random, users: int, count: int) -> list:
+    # 1~6자리 id 접두사: 짧을수록 매칭이 많아 결과 k개를 모두 채우는 경우
+    return [f"bench{rng.randint(1, users)}"[:rng.randint(5, 11)] for _ in range(count)]
+
+def timings_us(func, args: list) -> dict:
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        func(arg)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {"p50_us": round(percentile(samples, 0.5), 2), "p99_us": round(percentile(samples, 0.99), 2)}
+
+def measure_index(users: int, queries: int, limit: int, rng: random.Random) -> dict:
+    from app.prefix_index import PrefixIndex
+
+    nicknames = [f"bench{user_id}" for user_id in range(1, users + 1)]
+    index = PrefixIndex()
+    start = time.perf_counter()
+    index.build(nicknames)
+    build_seconds = time.perf_counter() - start
+    # 구성 중 최대 추가 메모리 (닉네임 문자열은 DB 조회 결과로 어차피 만들어지므로 제외)
+    tracemalloc.start()
+    PrefixIndex().build(nicknames)
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    new_nicknames = [f"fresh{i}" for i in range(min(queries, 1000))]
+    return {
+        "build_seconds": round(build_seconds, 3),
+        "build_peak_mb": round(memory / 2 ** 20, 1),
+        "search": timings_us(lambda prefix: index.search(prefix, limit), prefixes(rng, users, queries)),
+        "add": timings_us(index.add, new_nicknames),
+        "discard": timings_us(index.discard, new_nicknames),
+    }
+
+async def measure_sql(users: int, queries: int, limit: int, rng: random.Random) -> dict:
+    from sqlmodel import select
+    from app import models
+    from app.models import User
+
+    models.create_schema()
+    seed(models.get_engine(), users, 0, "bench")
+    samples = []
+    async with models.AsyncSessionLocal() as db:
+        for prefix in prefixes(rng, users, queries):
+            statement = (
+                select(User.nickname)
+                .where(User.nickname.startswith(prefix, autoescape=True), User.isDeleted == False)
+                .order_by(User.nickname)
+                .limit(limit)
+            )
+            start = time.perf_counter()
+            (await db.exec(statement)).all()
+            samples.append((time.perf_counter() - start) * 1e6)
+    await models.dispose_engines()
+    samples.sort()
+    return {"p50_us": round(percentile(samples, 0.5), 2), "p99_us": round(percentile(samples, 0.99), 2)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="닉네임 자동완성 벤치마크")
+    parser.add_argument("--users", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--sql-queries", type=int, default=50, help="DB LIKE 조회 횟수 (0이면 생략)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    results = {"users": args.users, "limit": args.limit, "index": measure_index(args.users, args.queries, args.limit, rng)}
+    if args.sql_queries:
+        with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+            configure_environment(workdir)
+            results["sql_like"] = asyncio.run(measure_sql(args.users, args.sql_queries, args.limit, rng))
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+bcrypt를 이벤트 루프에서 직접 실행할 때(inline)와 프로세스 풀에서 실행할 때(pool)의
+로그인 지연과, 같은 시간에 들어온 가벼운 요청(GET /)의 지연 비교
+
+    python -m bench.password_pool --logins 64 --concurrency 16
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+
+from bench.run import configure_environment, percentile
+from bench.seed import BENCH_PASSWORD, seed, user_email
+
+async def run(client, method: str, url: str, count: int, concurrency: int, build) -> dict:
+    latencies, next_index = [], 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < count:
+            i = next_index
+            next_index += 1
+            start = time.perf_counter()
+            response = await client.request(method, url, **build(i))
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "throughput_rps": round(count / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+    }
+
+async def measure(mode: str, users: int, logins: int, concurrency: int) -> dict:
+    from httpx import ASGITransport, AsyncClient
+    from app.main import app
+    from app.user import hashing
+
+    async with app.router.lifespan_context(app):
+        if mode == "inline":
+            hashing.shutdown_password_pool()  # 풀이 없으면 이벤트 루프에서 직접 해시
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            login = lambda i: {"json": {"email": user_email(i % users + 1), "password": BENCH_PASSWORD}}
+            login_task = asyncio.create_task(run(client, "POST", "/api/v1/users/login", logins, concurrency, login))
+            # 로그인이 진행되는 동안 10ms 간격으로 가벼운 요청을 보내 이벤트 루프가 막히는 시간을 측정
+            # (예정 시각부터 응답까지를 재야 루프가 막혀 요청을 보내지도 못한 시간이 포함됨)
+            root_latencies = []
+            while not login_task.done():
+                scheduled = time.perf_counter() + 0.01
+                await asyncio.sleep(0.01)
+                await client.get("/")
+                root_latencies.append(time.perf_counter() - scheduled)
+            login_result = await login_task
+    root_latencies.sort()
+    return {
+        "login": login_result,
+        "concurrent_root": {
+            "requests": len(root_latencies),
+            "p50_ms": round(percentile(root_latencies, 0.5) * 1000, 1),
+            "p99_ms": round(percentile(root_latencies, 0.99) * 1000, 1),
+        },
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="bcrypt 프로세스 풀 벤치마크")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    configure_environment(tempfile.mkdtemp(prefix="bench-"))
+    from app import models
+    from app.user.hashing import get_password_hash
+
+    models.create_schema()
+    seed(models.get_engine(), args.users, 0, get_password_hash(BENCH_PASSWORD))
+    results = {mode: asyncio.run(measure(mode, args.users, args.logins, args.concurrency)) for mode in ("inline", "pool")}
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+엔드투엔드 성능 벤치마크
+
+SQLite와 moto S3 위에서 app.main:app을 프로세스 내(httpx ASGITransport)로 띄우고,
+합성 데이터를 적재한 뒤 모든 API 라우트를 고정 동시성으로 호출해 결과를 JSON으로 출력한다.
+
+    pip install -r requirements.txt -r bench/requirements.txt
+    python -m bench.run --users 1000 --posts 20000 --output bench/result.json
+    python -m bench.run --baseline bench/result.json --fail-on-regression
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Callable, List, NamedTuple, Optional
+
+from bench.seed import BENCH_PASSWORD, WORDS, seed, seed_archive, user_email
+
+BUCKET_NAME = "profileuserbucket"
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+
+class Scenario(NamedTuple):
+    method: str
+    path: str
+    build: Callable  # (ctx, i) -> (url, request kwargs)
+    max_requests: Optional[int] = None
+    concurrency: Optional[int] = None  # 지정하면 --concurrency 대신 사용
+
+class BenchContext:
+    def __init__(self, users: int, posts: int, auth_users: int, requests: int, run_id: str):
+        self.users = users
+        self.posts = posts
+        self.requests = requests
+        self.auth_users = auth_users
+        self.run_id = run_id
+        self.access_tokens = {}
+        self.refresh_tokens = {}
+
+    def user_for(self, i: int) -> int:
+        return i % self.auth_users + 1
+
+    def auth(self, user_id: int) -> dict:
+        return {"Authorization": f"Bearer {self.access_tokens[user_id]}"}
+
+    def owned_blog(self, i: int) -> int:
+        """
+        요청마다 서로 다른, user_for(i)가 작성한 글 id
+        """
+        return self.user_for(i) + self.users * (i // self.auth_users)
+
+    def spare_blog(self, i: int) -> int:
+        """
+        owned_blog과 겹치지 않는(수정/삭제 라우트가 쓰지 않는) user_for(i)의 글 id
+        """
+        return self.owned_blog(i + self.requests)
+
+    def latest_profile(self) -> str:
+        """
+        프로파일링 시나리오가 저장한 가장 최근 프로파일 id (이후 새 프로파일이 없으므로 링에서 밀려나지 않음)
+        """
+        from app.profiling import list_profiles
+        return list_profiles()[0]["id"]
+
+def _import_body(ctx: BenchContext, i: int) -> bytes:
+    lines = [
+        json.dumps({"title": f"import {i}-{n}", "content": " ".join(WORDS[n % len(WORDS):]), "userId": ctx.user_for(n)})
+        for n in range(100)
+    ]
+    return "\n".join(lines).encode()
+
+def _batch_body(ctx: BenchContext, i: int) -> dict:
+    blog_id = ctx.spare_blog(i)
+    return {"operations": [
+        *({"op": "create", "title": f"batch {i}-{n}", "content": " ".join(WORDS)} for n in range(3)),
+        {"op": "update", "id": blog_id, "title": f"batch edited {i}", "content": " ".join(WORDS)},
+        {"op": "delete", "id": blog_id},
+    ]}
+
+def build_scenarios() -> List[Scenario]:
+    """
+    읽기 -> 쓰기 -> 삭제 순서로 실행 (삭제 라우트가 앞선 라우트의 데이터를 망가뜨리지 않도록)
+    복원 라우트는 아카이브 id(live 범위 다음)가 가입/글 작성으로 먼저 채워지지 않도록 쓰기 중 가장 먼저 실행
+    """
+    users = "/api/v1/users"
+    blogs = "/api/v1/blogs"
+    return [
+        Scenario("GET", "/", lambda ctx, i: ("/", {})),
+        Scenario("GET", "/metrics", lambda ctx, i: ("/metrics", {})),
+        Scenario("GET", f"{users}/email", lambda ctx, i: (f"{users}/email", {"params": {"email": user_email(i + 1) if i % 2 else f"free{i}@example.com"}})),
+        Scenario("GET", f"{users}/nickname", lambda ctx, i: (f"{users}/nickname", {"params": {"nickname": f"bench{i + 1}" if i % 2 else f"free{i}"}})),
+        Scenario("GET", f"{users}/nickname/suggest", lambda ctx, i: (f"{users}/nickname/suggest", {"params": {"prefix": f"bench{i % 100 + 1}"}})),
+        Scenario("GET", f"{users}/profile", lambda ctx, i: (f"{users}/profile", {"headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("POST", f"{users}/token", lambda ctx, i: (f"{users}/token", {"headers": {"Authorization": f"Bearer {ctx.refresh_tokens[ctx.user_for(i)]}"}})),
+        Scenario("POST", f"{users}/login", lambda ctx, i: (f"{users}/login", {"json": {"email": user_email(ctx.user_for(i)), "password": BENCH_PASSWORD}})),
+        Scenario("POST", f"{blogs}/archive/{{blog_id}}/restore", lambda ctx, i: (f"{blogs}/archive/{ctx.posts + 1 + i}/restore", {"headers": ctx.auth(1)})),
+        Scenario("POST", f"{users}/archive/{{user_id}}/restore", lambda ctx, i: (f"{users}/archive/{ctx.users + 1 + i}/restore", {"headers": ctx.auth(1)})),
+        Scenario("POST", f"{users}/signup", lambda ctx, i: (f"{users}/signup", {"json": {"email": f"signup-{ctx.run_id}-{i}@example.com", "password": BENCH_PASSWORD, "nickname": f"signup-{ctx.run_id}-{i}"}})),
+        Scenario("GET", blogs, lambda ctx, i: (blogs, {"params": {"limit": 20}})),
+        Scenario("GET", f"{blogs}/id", lambda ctx, i: (f"{blogs}/id", {"headers": ctx.auth(ctx.user_for(i))})),
+        # 인기 글 쏠림을 흉내 내도록 소수의 글을 반복 조회 (단건 캐시 적중)
+        Scenario("GET", f"{blogs}/{{blog_id}}", lambda ctx, i: (f"{blogs}/{i % 10 + 1}", {})),
+        # 프로파일러는 한 번에 한 요청만 측정하므로 동시성 1로 요청마다 cProfile/SQL 기록 오버헤드를 측정
+        Scenario("GET", f"{blogs} (X-Profile)", lambda ctx, i: (blogs, {"params": {"limit": 20}, "headers": {"X-Profile": "1", **ctx.auth(1)}}), max_requests=50, concurrency=1),
+        Scenario("GET", "/api/v1/profiles", lambda ctx, i: ("/api/v1/profiles", {"headers": ctx.auth(1)})),
+        Scenario("GET", "/api/v1/profiles/{profile_id}", lambda ctx, i: (f"/api/v1/profiles/{ctx.latest_profile()}", {"headers": ctx.auth(1)})),
+        Scenario("GET", "/api/v1/profiles/{profile_id}/sql", lambda ctx, i: (f"/api/v1/profiles/{ctx.latest_profile()}/sql", {"headers": ctx.auth(1)})),
+        Scenario("GET", f"{blogs}/search", lambda ctx, i: (f"{blogs}/search", {"params": {"q": f"{WORDS[i % len(WORDS)]} {WORDS[(i * 7) % len(WORDS)]}"}})),
+        Scenario("GET", f"{blogs}/export", lambda ctx, i: (f"{blogs}/export", {"headers": ctx.auth(1)}), max_requests=10),
+        Scenario("POST", blogs, lambda ctx, i: (blogs, {"json": {"title": f"bench {i}", "content": " ".join(WORDS)}, "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("POST", f"{blogs}/import", lambda ctx, i: (f"{blogs}/import", {"content": _import_body(ctx, i), "headers": ctx.auth(1)}), max_requests=20),
+        Scenario("PATCH", f"{blogs}/{{blog_id}}", lambda ctx, i: (f"{blogs}/{ctx.owned_blog(i)}", {"json": {"title": f"edited {i}", "content": " ".join(WORDS)}, "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("POST", f"{blogs}/batch", lambda ctx, i: (f"{blogs}/batch", {"json": _batch_body(ctx, i), "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("PATCH", f"{users}/profile", lambda ctx, i: (f"{users}/profile", {"data": {"nickname": f"bench{ctx.user_for(i)}"}, "files": {"file": ("me.png", PNG_BYTES, "image/png")}, "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("POST", f"{users}/profile/upload-url", lambda ctx, i: (f"{users}/profile/upload-url", {"json": {"filename": "me.png", "content_type": "image/png"}, "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("POST", f"{users}/profile/upload-confirm", lambda ctx, i: (f"{users}/profile/upload-confirm", {"json": {"key": f"profile/{ctx.user_for(i)}/bench.png"}, "headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("GET", "/api/v1/s3/test-s3", lambda ctx, i: ("/api/v1/s3/test-s3", {})),
+        Scenario("DELETE", f"{blogs}/{{blog_id}}", lambda ctx, i: (f"{blogs}/{ctx.owned_blog(i)}", {"headers": ctx.auth(ctx.user_for(i))})),
+        Scenario("DELETE", f"{users}/delete", lambda ctx, i: (f"{users}/delete", {"headers": ctx.auth(ctx.auth_users + 1 + i)})),
+    ]
+
+def configure_environment(workdir: str):
+    """
+    app.configs가 import 시점에 환경변수를 읽으므로 app을 import하기 전에 호출
+    """
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.update({
+        "LOCAL_DATABASE_URL": f"sqlite:///{workdir}/bench.db",
+        "JWT_SECRET_KEY": "bench-secret",
+        "JWT_ALGORITHM": "HS256",
+        "JWT_ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+        "JWT_REFRESH_TOKEN_EXPIRE_DAYS": "1",
+        "CREDENTIALS_ACCESS_KEY": "testing",
+        "CREDENTIALS_SECRET_KEY": "testing",
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "AWS_EC2_METADATA_DISABLED": "true",
+        "S3_BUCKET_NAME": BUCKET_NAME,
+        "SEARCH_INDEX_PATH": f"{workdir}/search_index.pkl",
+        "PROFILER_DIR": f"{workdir}/profiles",
+        "ADMIN_EMAILS": user_email(1),
+        # 모든 요청이 같은 클라이언트에서 오므로 처리율 제한을 끄고 라우트 자체의 비용을 측정
+        "RATE_LIMITS": "",
+    })
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+async def run_scenario(client, scenario: Scenario, ctx: BenchContext, requests: int, concurrency: int, queries: QueryCounter) -> dict:
+    total = min(requests, scenario.max_requests or requests)
+    latencies, statuses = [], Counter()
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < total:
+            i = next_index
+            next_index += 1
+            url, kwargs = scenario.build(ctx, i)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] += 1
+
+    queries_before = queries.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(scenario.concurrency or concurrency, total))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": sum(count for status, count in statuses.items() if status >= 500),
+        "status": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "queries_per_request": round((queries.count - queries_before) / total, 2),
+    }
+
+def uncovered_routes(app, scenarios: List[Scenario]) -> List[str]:
+    from fastapi.routing import APIRoute
+    covered = {f"{scenario.method} {scenario.path}" for scenario in scenarios}
+    routes = {f"{method} {route.path}" for route in app.routes if isinstance(route, APIRoute) for method in route.methods}
+    return sorted(routes - covered)
+
+def compare(result: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    기준 결과 대비 p95가 tolerance 이상 느려지거나 처리량이 tolerance 이상 줄어든 라우트 목록
+    """
+    regressions = []
+    for route, current in result["routes"].items():
+        previous = baseline.get("routes", {}).get(route)
+        if previous is None:
+            continue
+        p95_ratio = current["p95_ms"] / previous["p95_ms"] if previous["p95_ms"] else 1.0
+        rps_ratio = current["throughput_rps"] / previous["throughput_rps"] if previous["throughput_rps"] else 1.0
+        current["baseline"] = {"p95_ratio": round(p95_ratio, 3), "throughput_ratio": round(rps_ratio, 3)}
+        if p95_ratio > 1 + tolerance or rps_ratio < 1 - tolerance:
+            regressions.append(route)
+    return regressions
+
+async def bench(args) -> dict:
+    from moto import mock_aws
+    mock = mock_aws()
+    mock.start()
+
+    from httpx import ASGITransport, AsyncClient
+    from sqlalchemy import event
+    from app import models
+    from app.main import app
+    from app.bucket.s3_client import get_s3_client
+    from app.user.auth import AuthJWT
+    from app.user.hashing import get_password_hash
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    started = time.perf_counter()
+    models.create_schema()
+    password_hash = get_password_hash(BENCH_PASSWORD)
+    seed(models.get_engine(), args.users, args.posts, password_hash, seed=args.seed)
+    seed_archive(models.get_engine(), args.users, args.posts, args.requests, password_hash)
+    seed_seconds = time.perf_counter() - started
+
+    client_s3 = get_s3_client()
+    client_s3.create_bucket(Bucket=BUCKET_NAME)
+    ctx = BenchContext(args.users, args.posts, args.auth_users, args.requests, run_id=str(int(time.time())))
+    authorize = AuthJWT()
+    for user_id in range(1, args.auth_users + args.requests + 2):
+        ctx.access_tokens[user_id] = authorize.create_access_token(subject=user_email(user_id), expires_time=3600)
+        if user_id <= args.auth_users:
+            ctx.refresh_tokens[user_id] = authorize.create_refresh_token(subject=user_email(user_id))
+            client_s3.put_object(Bucket=BUCKET_NAME, Key=f"profile/{user_id}/bench.png", Body=PNG_BYTES, ContentType="image/png")
+
+    queries = QueryCounter()
+    event.listen(models.get_async_engine().sync_engine, "before_cursor_execute", queries)
+    event.listen(models.get_engine(), "before_cursor_execute", queries)
+
+    scenarios = build_scenarios()
+    for route in uncovered_routes(app, scenarios):
+        print(f"경고: 벤치마크 시나리오가 없는 라우트 {route}", file=sys.stderr)
+
+    routes = {}
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in scenarios:
+                key = f"{scenario.method} {scenario.path}"
+                routes[key] = await run_scenario(client, scenario, ctx, args.requests, args.concurrency, queries)
+                print(f"{key}: {routes[key]['throughput_rps']} rps, p95 {routes[key]['p95_ms']} ms", file=sys.stderr)
+
+    mock.stop()
+    return {
+        "config": {
+            "users": args.users,
+            "posts": args.posts,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "python": sys.version.split()[0],
+        },
+        "seed_seconds": round(seed_seconds, 3),
+        "routes": routes,
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 라우트 성능 벤치마크")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=200, help="라우트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--auth-users", type=int, default=50, help="요청에 사용할 로그인 유저 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 stdout)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 변화 비율")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+    if args.users < args.auth_users + args.requests + 1:
+        parser.error("--users는 --auth-users + --requests + 1 이상이어야 합니다 (회원 탈퇴 라우트용 유저 필요)")
+    if args.posts < args.users * (2 * args.requests // args.auth_users + 1):
+        parser.error("--posts가 부족합니다: 수정/삭제/일괄 변경 라우트가 요청마다 서로 다른 글을 사용합니다")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        configure_environment(workdir)
+        result = asyncio.run(bench(args))
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        result["regressions"] = regressions
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+    for route in regressions:
+        print(f"회귀: {route} {result['routes'][route]['baseline']}", file=sys.stderr)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
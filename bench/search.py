@@ -0,0 +1,76 @@
+"""
+검색 역색인 코퍼스 크기별 구성 시간과 검색 지연 시간 측정
+
+합성 글(Zipf 분포 어휘 + 한글 단어)로 InvertedIndex를 구성하고, 1~3단어 질의의 검색(BM25 top-k) 지연을 잰다.
+DB IN 조회는 결과 수(limit)에만 비례하므로 제외.
+
+    python -m bench.search --sizes 100000,1000000
+"""
+import argparse
+import gc
+import itertools
+import json
+import random
+import tempfile
+import time
+
+from bench.run import configure_environment, percentile
+from bench.seed import WORDS
+
+def vocabulary(size: int) -> list:
+    return [f"w{n}" for n in range(size)] + WORDS
+
+def documents(rng: random.Random, count: int, vocab: list, words: int):
+    # 단어 빈도가 실제 글처럼 소수 단어에 쏠리도록 Zipf 가중치 사용
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+    for doc_id in range(1, count + 1):
+        tokens = rng.choices(vocab, cum_weights=cum_weights, k=words + 3)
+        yield doc_id, " ".join(tokens[:3]), " ".join(tokens[3:])
+
+def measure(size: int, queries: int, words: int, limit: int, rng: random.Random) -> dict:
+    from app.blog.search import InvertedIndex
+
+    vocab = vocabulary(20000)
+    corpus = list(documents(rng, size, vocab, words))
+    index = InvertedIndex()
+    start = time.perf_counter()
+    for doc_id, title, content in corpus:
+        index.add(doc_id, title, content)
+    build_seconds = time.perf_counter() - start
+    del corpus
+
+    samples = []
+    for _ in range(queries):
+        query = " ".join(rng.choices(vocab[:2000], k=rng.randint(1, 3)))
+        start = time.perf_counter()
+        index.search(query, limit)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    result = {
+        "docs": size,
+        "terms": len(index.postings),
+        "build_seconds": round(build_seconds, 2),
+        "p50_ms": round(percentile(samples, 0.5), 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+    }
+    del index
+    gc.collect()
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="검색 역색인 벤치마크")
+    parser.add_argument("--sizes", default="100000,1000000", help="쉼표로 구분한 코퍼스 크기(글 수)")
+    parser.add_argument("--words", type=int, default=20, help="글당 본문 단어 수")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    configure_environment(tempfile.mkdtemp(prefix="bench-"))  # app.configs import에 필요한 환경변수
+    rng = random.Random(args.seed)
+    results = [measure(int(size), args.queries, args.words, args.limit, rng) for size in args.sizes.split(",")]
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
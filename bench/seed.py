@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+
+WORDS = [
+    "파이썬", "비동기", "프로그래밍", "데이터베이스", "성능", "캐시", "서버", "블로그", "여행", "제주도",
+    "개발", "배포", "인덱스", "쿼리", "트랜잭션", "테스트", "리팩터링", "모니터링", "로그", "버그",
+    "fastapi", "sqlmodel", "mysql", "asyncio", "docker", "redis", "python", "api", "latency", "throughput",
+]
+BATCH_SIZE = 5000
+BENCH_PASSWORD = "bench-password"
+
+def user_email(user_id: int) -> str:
+    return f"bench{user_id}@example.com"
+
+def blog_owner(blog_id: int, users: int) -> int:
+    """
+    글은 작성자에게 순서대로 배정되므로 id만으로 작성자를 알 수 있음
+    """
+    return (blog_id - 1) % users + 1
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+def _insert_batches(connection, model, rows: list):
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+def seed(engine, users: int, posts: int, password_hash: str, seed: int = 0):
+    """
+    합성 유저/글을 executemany 배치로 적재 (모든 유저는 같은 비밀번호 해시를 공유)
+    """
+    from app.models import User, Blog  # app.configs가 벤치마크 환경변수를 읽은 뒤에 import
+
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=365)
+    user_rows = [
+        {
+            "id": user_id,
+            "email": user_email(user_id),
+            "nickname": f"bench{user_id}",
+            "password": password_hash,
+            "createdAt": start,
+            "updatedAt": start,
+            "isDeleted": False,
+        }
+        for user_id in range(1, users + 1)
+    ]
+    blog_rows = []
+    for blog_id in range(1, posts + 1):
+        created_at = start + timedelta(seconds=blog_id)
+        blog_rows.append({
+            "id": blog_id,
+            "title": _text(rng, rng.randint(2, 6)),
+            "content": _text(rng, rng.randint(50, 300)),
+            "userId": blog_owner(blog_id, users),
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            "isDeleted": False,
+        })
+    with engine.begin() as connection:
+        _insert_batches(connection, User, user_rows)
+        _insert_batches(connection, Blog, blog_rows)
+
+def seed_archive(engine, users: int, posts: int, count: int, password_hash: str):
+    """
+    복원 라우트용 아카이브 행 적재 (id는 live 테이블 범위 다음부터, 글 작성자는 live 유저)
+    """
+    from app.models import BlogArchive, UserArchive
+
+    archived_at = datetime.now() - timedelta(days=1)
+    user_rows = [
+        {
+            "id": user_id,
+            "email": user_email(user_id),
+            "nickname": f"bench{user_id}",
+            "password": password_hash,
+            "createdAt": archived_at,
+            "updatedAt": archived_at,
+            "archivedAt": archived_at,
+        }
+        for user_id in range(users + 1, users + count + 1)
+    ]
+    blog_rows = [
+        {
+            "id": blog_id,
+            "title": f"archived {blog_id}",
+            "content": " ".join(WORDS),
+            "userId": blog_owner(blog_id, users),
+            "createdAt": archived_at,
+            "updatedAt": archived_at,
+            "archivedAt": archived_at,
+        }
+        for blog_id in range(posts + 1, posts + count + 1)
+    ]
+    with engine.begin() as connection:
+        _insert_batches(connection, UserArchive, user_rows)
+        _insert_batches(connection, BlogArchive, blog_rows)
@@ -0,0 +1,82 @@
+"""
+콜드 스타트 비용 측정 (새 프로세스에서 app.main import, lifespan 기동까지의 시간)
+
+    python -m bench.startup --runs 5
+    python -m bench.startup --runs 5 --warmup   # STARTUP_WARMUP 켠 기동 비용
+    python -m bench.startup --importtime        # import 시간이 큰 모듈 상위 목록
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from bench.run import configure_environment
+
+# 자식 프로세스에서 실행: import 시간과 lifespan 기동 시간을 ms로 출력
+CHILD = """
+import asyncio, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+async def startup():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+started = asyncio.run(startup())
+print((imported - start) * 1000, (started - imported) * 1000)
+"""
+
+def child_env(workdir: str, warmup: bool) -> dict:
+    configure_environment(workdir)
+    env = dict(os.environ)
+    env["LOG_LEVEL"] = "WARNING"
+    env["STARTUP_WARMUP"] = "true" if warmup else "false"
+    return env
+
+def migrate(env: dict):
+    subprocess.run([sys.executable, "-m", "app.migrate"], env=env, check=True, capture_output=True)
+
+def measure(runs: int, env: dict) -> dict:
+    imports, startups = [], []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", CHILD], env=env, check=True, capture_output=True, text=True).stdout
+        import_ms, startup_ms = map(float, output.split()[-2:])
+        imports.append(import_ms)
+        startups.append(startup_ms)
+    return {
+        "import_ms": round(statistics.median(imports), 1),
+        "lifespan_ms": round(statistics.median(startups), 1),
+        "total_ms": round(statistics.median(i + s for i, s in zip(imports, startups)), 1),
+    }
+
+def importtime(env: dict, top: int):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.main"], env=env, check=True, capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms  (self {self_us / 1000:>7.1f} ms)  {name}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="import/기동 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="STARTUP_WARMUP=true로 기동")
+    parser.add_argument("--importtime", action="store_true", help="-X importtime 기준 누적 시간 상위 모듈 출력")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = child_env(workdir, args.warmup)
+        if args.importtime:
+            importtime(env, args.top)
+            return
+        migrate(env)
+        result = measure(args.runs, env)
+    for name, value in result.items():
+        print(f"{name:>12}: {value} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+테스트 공통 설정: app.configs가 import 시점에 환경변수를 읽으므로 app을 import하기 전에 벤치마크와 같은 환경 구성
+"""
+import tempfile
+import pytest
+from bench.run import configure_environment
+
+configure_environment(tempfile.mkdtemp(prefix="tests-"))
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def db():
+    """
+    빈 스키마 위의 세션 (테스트마다 테이블을 다시 만들고 끝나면 엔진 정리)
+    """
+    from sqlmodel import SQLModel
+    from app import models
+
+    SQLModel.metadata.drop_all(models.get_engine())
+    models.create_schema()
+    async with models.AsyncSessionLocal() as session:
+        yield session
+    await models.dispose_engines()
@@ -0,0 +1,44 @@
+import pytest
+from sqlmodel import select
+from app.models import Blog, User
+from app.blog import crud
+from app.blog.schemas import BlogBatch
+
+pytestmark = pytest.mark.anyio
+
+async def seed_post(db) -> tuple:
+    user = User(email="batch@example.com", password="x", nickname="batch")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    blog = Blog(title="original", content="body", userId=user.id)
+    db.add(blog)
+    await db.commit()
+    await db.refresh(blog)
+    return user.id, blog.id
+
+def make_batch(blog_id: int, atomic: bool) -> BlogBatch:
+    return BlogBatch(atomic=atomic, operations=[
+        {"op": "create", "title": "new", "content": "body"},
+        {"op": "update", "id": blog_id, "title": "edited", "content": "body"},
+        {"op": "delete", "id": blog_id + 1000},
+    ])
+
+async def test_atomic_failure_marks_earlier_operations_rolled_back(db):
+    user_id, blog_id = await seed_post(db)
+    result = await crud.apply_blog_batch(db, make_batch(blog_id, atomic=True), user_id)
+
+    assert result["applied"] is False
+    assert [op["status"] for op in result["results"]] == [409, 409, 404]
+    assert result["results"][0]["id"] is None
+    titles = (await db.exec(select(Blog.title).where(Blog.userId == user_id))).all()
+    assert titles == ["original"]
+
+async def test_non_atomic_failure_applies_the_rest(db):
+    user_id, blog_id = await seed_post(db)
+    result = await crud.apply_blog_batch(db, make_batch(blog_id, atomic=False), user_id)
+
+    assert result["applied"] is True
+    assert [op["status"] for op in result["results"]] == [201, 200, 404]
+    titles = (await db.exec(select(Blog.title).where(Blog.userId == user_id).order_by(Blog.id))).all()
+    assert titles == ["edited", "new"]
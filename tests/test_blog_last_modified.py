@@ -0,0 +1,27 @@
+import pytest
+from datetime import datetime, timedelta
+from app.models import Blog, User
+from app.blog.crud import get_blogs_last_modified
+from app.user import crud
+from app.user.schemas import UpdateUserBase
+
+pytestmark = pytest.mark.anyio
+
+async def test_profile_change_advances_list_last_modified(db):
+    long_ago = datetime.now() - timedelta(days=1)
+    user = User(email="author@example.com", password="x", nickname="author", createdAt=long_ago, updatedAt=long_ago)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    db.add(Blog(title="post", content="body", userId=user.id, createdAt=long_ago, updatedAt=long_ago))
+    await db.commit()
+    assert await get_blogs_last_modified(db) == long_ago
+    assert await get_blogs_last_modified(db, user.id) == long_ago
+
+    # 글은 그대로지만 목록에 보이는 작성자 닉네임이 바뀌었으므로 If-Modified-Since에 304가 나가면 안 됨
+    assert await crud.update_user_profile(db, "author@example.com", UpdateUserBase(nickname="renamed"))
+    assert await get_blogs_last_modified(db) > long_ago
+    assert await get_blogs_last_modified(db, user.id) > long_ago
+
+async def test_last_modified_without_rows(db):
+    assert await get_blogs_last_modified(db) is None
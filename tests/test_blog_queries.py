@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+from app import models
+from app.models import Blog, User
+from app.blog import crud
+
+pytestmark = pytest.mark.anyio
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+async def seed_posts(db, count: int) -> User:
+    user = User(email=f"writer{count}@example.com", password="x", nickname=f"writer{count}")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    db.add_all(Blog(title=f"post {n}", content="body", userId=user.id) for n in range(count))
+    await db.commit()
+    return user
+
+async def count_queries(db, call) -> int:
+    counter = QueryCounter()
+    engine = models.get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        page, _ = await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+    assert all(blog["author"] is not None for blog in page)
+    return counter.count
+
+@pytest.mark.parametrize("listing", ["all", "user"])
+async def test_list_query_count_is_constant(db, listing):
+    counts = []
+    for posts in (1, 10, 100):
+        user = await seed_posts(db, posts)
+        if listing == "all":
+            call = lambda: crud.get_all_blogs(db, limit=100)
+        else:
+            call = lambda: crud.get_blogs_by_user(db, user.id, limit=100)
+        counts.append(await count_queries(db, call))
+    assert counts == [1, 1, 1]  # 작성자는 join으로 함께 조회하므로 글 수와 무관하게 한 번
+
+async def test_relationship_access_raises_instead_of_lazy_loading(db):
+    user = await seed_posts(db, 1)
+    blog = (await db.exec(select(Blog))).first()
+    with pytest.raises(InvalidRequestError):
+        blog.author
+    fresh_user = (await db.exec(select(User).where(User.id == user.id))).first()
+    with pytest.raises(InvalidRequestError):
+        fresh_user.blogs
@@ -0,0 +1,73 @@
+import io
+import pytest
+from fastapi import HTTPException
+from moto import mock_aws
+from starlette.datastructures import Headers, UploadFile
+
+from app.bucket import crud, s3_client
+from app.configs import S3_BUCKET_NAME, S3_MULTIPART_CHUNK_MB
+
+pytestmark = pytest.mark.anyio
+
+MB = s3_client.MB
+
+@pytest.fixture
+def s3(monkeypatch):
+    # bench.run과 같은 moto 스탠드인, 모듈에 캐시된 클라이언트는 테스트마다 새로
+    monkeypatch.setattr(s3_client, "_client_s3", None)
+    monkeypatch.setattr(crud, "_bucket_location", None)
+    with mock_aws():
+        client = s3_client.get_s3_client()
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+        yield client
+
+def upload(body: bytes, size=None) -> UploadFile:
+    return UploadFile(io.BytesIO(body), size=size, filename="image.png", headers=Headers({"content-type": "image/png"}))
+
+def uploaded_keys(client) -> list:
+    return [item["Key"] for item in client.list_objects_v2(Bucket=S3_BUCKET_NAME).get("Contents", [])]
+
+async def test_large_file_is_streamed_as_multipart(s3):
+    body = b"x" * (S3_MULTIPART_CHUNK_MB * MB * 2 + MB)
+    url = await crud.upload_file_to_s3(upload(body), max_bytes=len(body))
+
+    [key] = uploaded_keys(s3)
+    assert url.endswith(key)
+    head = s3.head_object(Bucket=S3_BUCKET_NAME, Key=key)
+    assert head["ContentLength"] == len(body)
+    assert head["ContentType"] == "image/png"
+    assert head["ETag"].strip('"').endswith("-3")  # 파트 3개로 업로드
+
+async def test_oversized_stream_is_rejected_without_reading_whole_body(s3):
+    body = b"x" * (S3_MULTIPART_CHUNK_MB * MB * 4)
+    file = upload(body)  # 크기를 모르는 스트림
+    with pytest.raises(HTTPException) as exc:
+        await crud.upload_file_to_s3(file, max_bytes=MB)
+
+    assert exc.value.status_code == 413
+    assert file.file.tell() <= S3_MULTIPART_CHUNK_MB * MB < len(body)
+    assert uploaded_keys(s3) == []
+    assert s3.list_multipart_uploads(Bucket=S3_BUCKET_NAME).get("Uploads", []) == []
+
+async def test_oversized_file_with_known_size_is_rejected_before_upload(s3):
+    body = b"x" * (2 * MB)
+    file = upload(body, size=len(body))
+    with pytest.raises(HTTPException) as exc:
+        await crud.upload_file_to_s3(file, max_bytes=MB)
+
+    assert exc.value.status_code == 413
+    assert file.file.tell() == 0
+    assert uploaded_keys(s3) == []
+
+async def test_object_url_is_resolved_off_the_event_loop(s3):
+    assert await crud.get_object_url_async("profile/1/me.png") == f"https://{S3_BUCKET_NAME}.s3-us-east-1.amazonaws.com/profile/1/me.png"
+
+async def test_missing_credentials_on_head_is_a_server_error(s3, monkeypatch):
+    from botocore.exceptions import NoCredentialsError
+
+    def no_credentials():
+        raise NoCredentialsError()
+    monkeypatch.setattr(crud, "get_s3_client", no_credentials)
+    with pytest.raises(HTTPException) as exc:
+        await crud.head_uploaded_object("profile/1/me.png")
+    assert exc.value.status_code == 500
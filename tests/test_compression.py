@@ -0,0 +1,40 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import Response
+from app.compression import CompressionMiddleware
+
+pytestmark = pytest.mark.anyio
+
+ETAG = '"abc"'
+
+def make_app(body: bytes, status: int = 200, media_type: str = "application/json"):
+    async def app(scope, receive, send):
+        if status == 304:
+            response = Response(status_code=304, headers={"ETag": ETAG})
+        else:
+            response = Response(content=body, media_type=media_type, headers={"ETag": ETAG})
+        await response(scope, receive, send)
+    return CompressionMiddleware(app, minimum_size=100)
+
+async def get(app, accept_encoding: str):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/", headers={"Accept-Encoding": accept_encoding})
+
+@pytest.mark.parametrize("body, status", [(b"x" * 1000, 200), (b"{}", 200), (b"", 304)])
+async def test_negotiated_responses_share_weak_etag_and_vary(body, status):
+    # 압축된 큰 응답, 압축하지 않은 작은 응답, 304 모두 같은 ETag/Vary
+    response = await get(make_app(body, status), "gzip")
+    assert response.status_code == status
+    assert response.headers["etag"] == f"W/{ETAG}"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+async def test_identity_response_keeps_strong_etag_with_vary():
+    response = await get(make_app(b"x" * 1000), "identity")
+    assert response.headers["etag"] == ETAG
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in response.headers
+
+async def test_non_compressible_type_is_untouched():
+    response = await get(make_app(b"x" * 1000, media_type="image/png"), "gzip")
+    assert response.headers["etag"] == ETAG
+    assert "vary" not in response.headers
@@ -0,0 +1,27 @@
+import os
+import signal
+import pytest
+from fastapi import HTTPException
+from app.user import hashing
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def pool():
+    await hashing.start_password_pool()
+    yield
+    hashing.shutdown_password_pool()
+
+async def test_broken_pool_returns_503_and_is_rebuilt(pool):
+    hashed = await hashing.get_password_hash_async("secret")
+    broken = hashing._executor
+    for process in list(broken._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+
+    with pytest.raises(HTTPException) as error:
+        await hashing.verify_password_async("secret", hashed)
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == "1"
+
+    assert hashing._executor is not broken
+    assert await hashing.verify_password_async("secret", hashed)
@@ -0,0 +1,54 @@
+import orjson
+import pytest
+from sqlmodel import select
+from app.models import Blog, User
+from app.blog.crud import export_blogs_ndjson, import_blogs_ndjson
+
+pytestmark = pytest.mark.anyio
+
+async def test_export_import_round_trip(db):
+    user = User(email="writer@example.com", password="x", nickname="writer")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    db.add(Blog(title="popular", content="body", userId=user.id, viewCount=7))
+    db.add(Blog(title="gone", content="body", userId=user.id, isDeleted=True, viewCount=3))
+    await db.commit()
+
+    exported = b"".join([chunk async for chunk in export_blogs_ndjson(db, include_deleted=True)])
+    original = [blog.model_dump() for blog in (await db.exec(select(Blog).order_by(Blog.id))).all()]
+    await db.exec(Blog.__table__.delete())
+    await db.commit()
+
+    async def chunks():
+        yield exported
+
+    report = await import_blogs_ndjson(db, chunks())
+    assert report["inserted"] == 2 and not report["errors"]
+    db.expunge_all()
+    restored = [blog.model_dump() for blog in (await db.exec(select(Blog).order_by(Blog.id))).all()]
+    assert restored == original
+
+async def test_import_indexes_each_batch_once(db, monkeypatch):
+    from app.blog import crud
+
+    user = User(email="importer@example.com", password="x", nickname="importer")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    applied = []
+    monkeypatch.setattr(crud.search_index, "apply", lambda blog: applied.append(blog.id))
+    monkeypatch.setattr(crud, "BLOG_IMPORT_BATCH_SIZE", 3)
+
+    # 내보낸 파일처럼 id가 있는 줄과 id 없이 새로 만드는 줄이 섞인 입력
+    lines = [orjson.dumps({"id": 100 + n, "title": f"t{n}", "content": "body", "userId": user.id}) for n in range(4)]
+    lines += [orjson.dumps({"title": f"new{n}", "content": "body", "userId": user.id}) for n in range(3)]
+
+    async def chunks():
+        yield b"\n".join(lines)
+
+    report = await import_blogs_ndjson(db, chunks())
+    assert report["inserted"] == 7 and len(report["batches"]) == 3
+    ids = (await db.exec(select(Blog.id).order_by(Blog.id))).all()
+    # 배치마다 그 배치에서 삽입한 글만 한 번씩 색인
+    assert sorted(applied) == list(ids) and len(applied) == len(set(applied))
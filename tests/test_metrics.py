@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import models
+from app.metrics import RequestStats, request_stats
+
+pytestmark = pytest.mark.anyio
+
+async def test_failed_statement_leaves_no_timing_on_connection(db):
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    try:
+        with pytest.raises(OperationalError):
+            await db.exec(text("SELECT * FROM missing_table"))
+        await db.rollback()
+        await db.exec(text("SELECT 1"))
+        connection = await db.connection()
+        raw_info = (await connection.get_raw_connection()).info
+    finally:
+        request_stats.reset(token)
+    assert "query_start" not in raw_info
+    assert stats.queries == 1 and 0 <= stats.db_time < 5
@@ -0,0 +1,19 @@
+import pytest
+from app.configs import ADMIN_EMAILS
+from app.profiling import ProfilingMiddleware
+from app.user.auth import AuthJWT
+
+def profile_scope(token: str) -> dict:
+    return {"type": "http", "headers": [(b"x-profile", b"1"), (b"authorization", f"Bearer {token}".encode())]}
+
+@pytest.fixture
+def middleware():
+    return ProfilingMiddleware(app=None, sample_rate=0)
+
+def test_admin_access_token_triggers_profile(middleware):
+    token = AuthJWT().create_access_token(subject=ADMIN_EMAILS[0])
+    assert middleware._trigger(profile_scope(token)) == "admin"
+
+def test_admin_refresh_token_is_rejected(middleware):
+    token = AuthJWT().create_refresh_token(subject=ADMIN_EMAILS[0])
+    assert middleware._trigger(profile_scope(token)) is None
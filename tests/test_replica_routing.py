@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel, select
+from app import models
+from app.models import User, use_replica
+from app.user import crud
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """
+    primary와 별도인 SQLite 파일을 복제본으로 사용 (복제가 따라오지 않은 상태를 흉내 내도록 일부 행만 넣음)
+    """
+    url = f"sqlite:///{tmp_path}/replica.db"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(User.__table__.insert(), [{"email": "replica@example.com", "password": "x", "nickname": "replica-only"}])
+    engine.dispose()
+    monkeypatch.setattr(models, "DATABASE_REPLICA_URLS", [url])
+    monkeypatch.setattr(models, "_replica_engines", None)
+    monkeypatch.setattr(crud, "user_filters_ready", False)
+
+async def nicknames(db, statement) -> list:
+    return list((await db.exec(statement)).all())
+
+async def test_marked_reads_go_to_replica_until_session_writes(db, replica):
+    statement = select(User.nickname).order_by(User.id)
+    assert await nicknames(db, use_replica(statement)) == ["replica-only"]
+    assert await nicknames(db, statement) == []
+
+    db.add(User(email="new@example.com", password="x", nickname="fresh"))
+    await db.flush()
+    # 쓰기 이후에는 표시된 조회도 primary에서 읽어 방금 쓴 행이 보임
+    assert await nicknames(db, use_replica(statement)) == ["fresh"]
+    await db.commit()
+    assert await nicknames(db, use_replica(statement)) == ["fresh"]
+
+async def test_write_path_duplicate_checks_read_primary(db, replica):
+    db.add(User(email="taken@example.com", password="x", nickname="taken"))
+    await db.commit()
+
+    async with models.AsyncSessionLocal() as session:
+        # 복제본에는 아직 없지만 primary에는 있는 닉네임/이메일
+        assert await crud.check_nickname_duplicate(session, "taken")
+        assert await crud.check_email_duplicate(session, "taken@example.com")
+        assert not await crud.check_nickname_duplicate(session, "taken", replica=True)
+        assert await crud.check_nickname_duplicate(session, "replica-only", replica=True)
+        assert not await crud.check_nickname_duplicate(session, "replica-only")
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+import pytest
+from app.models import Blog, User
+from app.blog.schemas import BlogBase, BlogSummary
+from app.blog.search import InvertedIndex, search_index, sync_search_index
+from app.blog import crud
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    search_index.__init__()
+    yield
+    search_index.__init__()
+
+async def add_user(db) -> User:
+    user = User(email="writer@example.com", password="x", nickname="writer")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+async def test_sync_picks_up_rows_committed_behind_local_writes(db):
+    user = await add_user(db)
+    start = datetime.now() - timedelta(seconds=10)
+    db.add(Blog(title="first post", content="body", userId=user.id, createdAt=start, updatedAt=start))
+    await db.commit()
+    await sync_search_index(db)
+    watermark = search_index.watermark
+
+    # 다른 워커가 먼저 시작해 더 이른 updatedAt으로 늦게 커밋한 글
+    late = start + timedelta(seconds=1)
+    db.add(Blog(title="straggler", content="body", userId=user.id, createdAt=late, updatedAt=late))
+    await db.commit()
+    # 이 워커의 로컬 쓰기는 watermark를 움직이지 않음
+    await crud.create_blog(db, BlogBase(title="local", content="body"), user.id)
+    assert search_index.watermark == watermark
+
+    await sync_search_index(db)
+    assert [blog["title"] for blog in await crud.search_blogs(db, "straggler", 10)] == ["straggler"]
+    assert search_index.watermark > watermark
+
+async def test_sync_skips_rows_already_applied_in_overlap(db, monkeypatch):
+    user = await add_user(db)
+    db.add(Blog(title="once", content="body", userId=user.id))
+    await db.commit()
+    await sync_search_index(db)
+
+    applied = []
+    monkeypatch.setattr(search_index, "apply", lambda blog: applied.append(blog.id))
+    await sync_search_index(db)
+    assert applied == []
+
+async def test_search_returns_summary_projection(db):
+    user = await add_user(db)
+    await crud.create_blog(db, BlogBase(title="projection", content="secret " * 200), user.id)
+    [result] = await crud.search_blogs(db, "projection", 10)
+    assert set(result) == set(BlogSummary.model_fields)
+    assert result["author"] == {"nickname": "writer", "profileUrl": None}
+
+def test_save_uses_private_temp_file(tmp_path):
+    path = tmp_path / "index.pkl"
+    index = InvertedIndex()
+    index.add(1, "hello", "world")
+    index.save(str(path))
+    index.save(str(path))
+    assert [p.name for p in tmp_path.iterdir()] == ["index.pkl"]
+    loaded = InvertedIndex()
+    assert loaded.load(str(path)) and loaded.search("hello", 1)[0][0] == 1
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert
+from app.models import User
+from app.user import crud
+from app.user.schemas import UserBase
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def filters(db, monkeypatch):
+    monkeypatch.setattr(crud, "user_filters_ready", False)
+    await crud.load_user_filters(db)
+    # 필터 구성 후 다른 워커에서 가입한 유저 (이 워커의 블룸 필터에는 없음)
+    await db.exec(insert(User).values(email="other@example.com", password="x", nickname="taken"))
+    await db.commit()
+
+async def test_nickname_taken_on_another_worker_is_rejected(db, filters):
+    assert not await crud.check_nickname_duplicate(db, "taken", replica=True)  # 필터는 모름
+    with pytest.raises(HTTPException) as error:
+        await crud.create_user(db, UserBase(email="new@example.com", password="pw", nickname="taken"))
+    assert error.value.status_code == 400
+
+async def test_unique_index_race_is_reported_as_bad_request(db, filters, monkeypatch):
+    async def not_duplicate(*args, **kwargs):
+        return False
+    # 중복 확인 직후 다른 요청이 닉네임을 가져간 상황
+    monkeypatch.setattr(crud, "check_nickname_duplicate", not_duplicate)
+    with pytest.raises(HTTPException) as error:
+        await crud.create_user(db, UserBase(email="new@example.com", password="pw", nickname="taken"))
+    assert error.value.status_code == 400
+    assert error.value.detail == "이미 사용 중인 닉네임입니다."
@@ -0,0 +1,39 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import insert, update
+from app.models import User
+from app.user import crud
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def loaded(db, monkeypatch):
+    monkeypatch.setattr(crud, "user_filters_ready", False)
+    db.add_all([
+        User(email="kept@example.com", password="x", nickname="nick-kept"),
+        User(email="renamed@example.com", password="x", nickname="nick-old"),
+        User(email="leaving@example.com", password="x", nickname="nick-leaving"),
+    ])
+    await db.commit()
+    await crud.load_user_filters(db)
+
+async def other_worker_writes(db):
+    # 이 워커의 인덱스를 거치지 않은 가입/닉네임 변경/탈퇴
+    now = datetime.now()
+    await db.exec(insert(User).values(email="joined@example.com", password="x", nickname="nick-joined"))
+    await db.exec(update(User).where(User.email == "renamed@example.com").values(nickname="nick-new", updatedAt=now))
+    await db.exec(update(User).where(User.email == "leaving@example.com").values(isDeleted=True, updatedAt=now))
+    await db.commit()
+
+async def test_sync_picks_up_other_workers_changes(db, loaded):
+    await other_worker_writes(db)
+    assert await crud.suggest_nicknames(db, "nick-", 10) == ["nick-kept", "nick-leaving", "nick-old"]
+
+    await crud.sync_user_index(db)
+    await crud.sync_user_index(db)  # 겹침 구간을 다시 읽어도 중복되지 않음
+    # 옛 닉네임은 전체 재구성 전까지 남음
+    assert await crud.suggest_nicknames(db, "nick-", 10) == ["nick-joined", "nick-kept", "nick-new", "nick-old"]
+    assert await crud.check_email_duplicate(db, "joined@example.com", replica=True)
+
+    await crud.load_user_filters(db)
+    assert await crud.suggest_nicknames(db, "nick-", 10) == ["nick-joined", "nick-kept", "nick-new"]
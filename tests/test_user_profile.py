@@ -0,0 +1,41 @@
+import pytest
+from fastapi import HTTPException
+from app.models import User
+from app.user import crud
+from app.user.schemas import UpdateUserBase
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+async def users(db):
+    db.add_all([
+        User(email="first@example.com", password="x", nickname="first"),
+        User(email="second@example.com", password="x", nickname="second"),
+    ])
+    await db.commit()
+
+async def test_rename_to_taken_nickname_is_rejected(db, users):
+    with pytest.raises(HTTPException) as error:
+        await crud.update_user_profile(db, "second@example.com", UpdateUserBase(nickname="first"))
+    assert error.value.status_code == 400
+
+async def test_unique_index_race_is_reported_as_conflict(db, users, monkeypatch):
+    async def not_duplicate(*args, **kwargs):
+        return False
+    # 중복 확인 직후 다른 요청이 닉네임을 가져간 상황
+    monkeypatch.setattr(crud, "check_nickname_duplicate", not_duplicate)
+    with pytest.raises(HTTPException) as error:
+        await crud.update_user_profile(db, "second@example.com", UpdateUserBase(nickname="first"))
+    assert error.value.status_code == 400
+
+async def test_rename_and_keep_own_nickname(db, users):
+    assert await crud.update_user_profile(db, "second@example.com", UpdateUserBase(nickname="second"))
+    assert await crud.update_user_profile(db, "second@example.com", UpdateUserBase(nickname="renamed"))
+    assert (await crud.get_user(db, "second@example.com")).nickname == "renamed"
+
+async def test_profile_url_update_keeps_current_nickname(db, users):
+    # 다른 워커에서 닉네임이 바뀐 뒤 (이 워커의 CurrentUser 캐시에는 옛 닉네임) 업로드 확인
+    assert await crud.update_user_profile(db, "second@example.com", UpdateUserBase(nickname="renamed"))
+    assert await crud.set_profile_url(db, "second@example.com", "https://bucket/profile/2/me.png")
+    user = await crud.get_user(db, "second@example.com")
+    assert (user.nickname, user.profileUrl) == ("renamed", "https://bucket/profile/2/me.png")